@@ -1,5 +1,6 @@
 # FreeBirdPDF.py
 import sys
+import multiprocessing
 from PyQt6.QtWidgets import QApplication
 
 # Import main components
@@ -13,4 +14,6 @@ def main():
     sys.exit(app.exec())
 
 if __name__ == "__main__":
+    # Thumbnail render workers are spawned processes; needed for frozen builds
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -6,6 +6,22 @@ RESOURCES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resour
 BACKGROUND_IMAGE_PATH = os.path.join(RESOURCES_DIR, "FreeBird.png")
 ICON_PATH = os.path.join(RESOURCES_DIR, "pdf_icon.png")
 
+# Cache paths - honour XDG_CACHE_HOME when set
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "FreeBirdPDF"
+)
+
+# Memory budget (KB) for rendered pages, shared by all open tabs. The budget
+# is a tenth of the memory available at startup, kept within these bounds;
+# the minimum is also used when available memory can't be determined
+PAGE_CACHE_LIMIT_KB = 128 * 1024
+PAGE_CACHE_MAX_KB = 1024 * 1024
+PAGE_CACHE_MEMORY_FRACTION = 0.1
+
+# PDFs up to this size (bytes) are read into memory in one go when opened
+PDF_IN_MEMORY_MAX_BYTES = 64 * 1024 * 1024
+
 # Other constants
 ASSEMBLY_PREFIX = "assembly:/"
-VERSION = "0.2.0 - Second Flight"
\ No newline at end of file
+VERSION = "0.2.0 - Second Flight"
@@ -12,6 +12,8 @@ from PyQt6.QtCore import Qt
 from freebird.constants import BACKGROUND_IMAGE_PATH, VERSION
 
 class AboutDialog(QDialog):
+    _logo_pixmap = None  # Scaled logo, shared by every time the dialog is opened
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("About FreeBird PDF")
@@ -24,13 +26,14 @@ class AboutDialog(QDialog):
         logo_label = QLabel()
         logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         try:
-            if os.path.exists(BACKGROUND_IMAGE_PATH):
+            if AboutDialog._logo_pixmap is None and os.path.exists(BACKGROUND_IMAGE_PATH):
                 pixmap = QPixmap(BACKGROUND_IMAGE_PATH)
                 if not pixmap.isNull():
-                    scaled_pixmap = pixmap.scaled(250, 250, Qt.AspectRatioMode.KeepAspectRatio, 
-                                                 Qt.TransformationMode.SmoothTransformation)
-                    logo_label.setPixmap(scaled_pixmap)
-                    layout.addWidget(logo_label)
+                    AboutDialog._logo_pixmap = pixmap.scaled(250, 250, Qt.AspectRatioMode.KeepAspectRatio, 
+                                                             Qt.TransformationMode.SmoothTransformation)
+            if AboutDialog._logo_pixmap is not None:
+                logo_label.setPixmap(AboutDialog._logo_pixmap)
+                layout.addWidget(logo_label)
         except Exception as e:
             print(f"Could not load logo: {e}")
         
@@ -8,25 +8,72 @@ from PyQt6.QtWidgets import (
     QTabWidget, QMessageBox, QProgressDialog, QLineEdit
 )
 from PyQt6.QtGui import (
-    QPixmap, QIcon, QAction, QKeySequence, QPainter,
-    QIntValidator
+    QPixmap, QPixmapCache, QIcon, QAction, QKeySequence, QPainter,
+    QIntValidator, QImage, QImageReader
+)
+from PyQt6.QtCore import (
+    Qt, QSize, QPoint, QRect, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
 )
-from PyQt6.QtCore import Qt, QSize, QPoint, QRect, QTimer
 
 # Import from other modules in the new structure
-from freebird.ui.pdf_view import PDFViewWidget
+from freebird.ui.pdf_view import PDFViewWidget, shutdown_render_executor
 from freebird.ui.search_panel import SearchPanel
 from freebird.ui.about_dialog import AboutDialog
 from freebird.utils.thumbnail import ThumbnailViewDialog
-from freebird.utils.helpers import show_message
+from freebird.utils.helpers import show_message, save_pdf, shrink_mupdf_store, page_cache_limit_kb
 from freebird.constants import BACKGROUND_IMAGE_PATH, ICON_PATH, VERSION, ASSEMBLY_PREFIX
 
+# ============================================================
+#  Background image loading
+# ============================================================
+class ImageLoadSignals(QObject):
+    """Signals for ImageLoadTask."""
+    image_loaded = pyqtSignal(QImage)  # A null image if decoding failed
+
+class ImageLoadTask(QRunnable):
+    """
+    Decodes an image file on a QThreadPool thread.
+    
+    Only QImage may be used off the GUI thread; the receiver turns it into
+    a QPixmap.
+    """
+    
+    def __init__(self, path, signals):
+        super().__init__()
+        self.path = path
+        self.signals = signals
+    
+    def run(self):
+        reader = QImageReader(self.path)
+        image = reader.read()
+        if image.isNull():
+            print(f"WARNING: Failed to load background image: {reader.errorString()}")
+        self.signals.image_loaded.emit(image)
+
 class PDFViewer(QMainWindow):
     def __init__(self):
         super().__init__()
         self.assembly_tab_count = 0
         self.background_pixmap = None
-        self.search_panel = None
+        self.scaled_background = None  # background_pixmap scaled to the window, redone only on resize
+        self.background_visible = False  # Whether the background is showing (no tabs open)
+        self.search_panel = None  # Created the first time search is opened
+        self.about_dialog = None
+        self.confirm_box = None  # Reused by ask_question, created on first use
+        
+        # Toolbar refreshes requested during one event (tab switch, page display,
+        # edit) are applied once, when control returns to the event loop
+        self._ui_update_timer = QTimer(self)
+        self._ui_update_timer.setSingleShot(True)
+        self._ui_update_timer.setInterval(0)
+        self._ui_update_timer.timeout.connect(self.refresh_ui_for_current_tab)
+        self._button_update_timer = QTimer(self)
+        self._button_update_timer.setSingleShot(True)
+        self._button_update_timer.setInterval(0)
+        self._button_update_timer.timeout.connect(self.refresh_button_states)
+        
+        # Rendered pages from every tab share one LRU cache, sized to the machine
+        QPixmapCache.setCacheLimit(page_cache_limit_kb())
         
         # Load icon and background
         self.load_resources()
@@ -50,20 +97,26 @@ class PDFViewer(QMainWindow):
             else:
                 print(f"INFO: Icon file not found.")
                 
-            # Load background image
+            # Decode the background image in the background; the window
+            # shows without it and repaints once it arrives
             if os.path.exists(BACKGROUND_IMAGE_PATH):
-                self.background_pixmap = QPixmap(BACKGROUND_IMAGE_PATH)
-                if self.background_pixmap.isNull():
-                    print(f"WARNING: Failed to load background image.")
-                    self.background_pixmap = None
-                else:
-                    print(f"INFO: Background image loaded.")
+                self.background_signals = ImageLoadSignals()  # Unparented: the task may outlive the window
+                self.background_signals.image_loaded.connect(self.on_background_loaded)
+                QThreadPool.globalInstance().start(ImageLoadTask(BACKGROUND_IMAGE_PATH, self.background_signals))
             else:
                 print(f"INFO: Background image not found.")
         except Exception as e:
             print(f"WARNING: Could not load resources: {e}")
             self.background_pixmap = None
 
+    def on_background_loaded(self, image):
+        """Slot receiving the decoded background image from ImageLoadTask."""
+        if image.isNull():
+            return
+        self.background_pixmap = QPixmap.fromImage(image)
+        print(f"INFO: Background image loaded.")
+        self.update_background()
+
     def init_ui(self):
         self.setWindowTitle(f"FreeBird PDF v{VERSION}")
         self.setGeometry(100, 100, 1100, 800)
@@ -78,11 +131,9 @@ class PDFViewer(QMainWindow):
         toolbar_layout = QHBoxLayout()
         self.create_toolbar(toolbar_layout)  # Create toolbar FIRST - this creates all buttons
         container_layout.addLayout(toolbar_layout)
+        self.container_layout = container_layout
 
-        # Search panel (initially hidden)
-        self.search_panel = SearchPanel(self)
-        self.search_panel.hide()
-        container_layout.addWidget(self.search_panel)
+        # The search panel goes below the toolbar once it is first needed (see ensure_search_panel)
 
         # Tab Widget setup
         self.tabs = QTabWidget()
@@ -94,8 +145,9 @@ class PDFViewer(QMainWindow):
         self.tabs.setStyleSheet("QTabWidget::pane { border: none; background: transparent; } QTabBar::tab { background: lightgray; min-width: 100px; padding: 5px;} QTabBar::tab:selected { background: white; }")
         container_layout.addWidget(self.tabs)
 
-        # NOW call update_button_states AFTER all buttons have been created
-        self.update_button_states()
+        # NOW call refresh_button_states AFTER all buttons have been created
+        self.refresh_button_states()
+        self.background_visible = self.background_pixmap is not None and self.tabs.count() == 0
 
     def paintEvent(self, event):
         """Overrides paint event to draw background image when no tabs are open."""
@@ -103,22 +155,36 @@ class PDFViewer(QMainWindow):
         super().paintEvent(event)
         
         # Draw background only if image loaded and no tabs are open
-        if self.background_pixmap and self.tabs.count() == 0:
+        if self.background_visible:
             painter = QPainter(self)
             
-            # Scale pixmap to fit window while keeping aspect ratio
-            scaled_pixmap = self.background_pixmap.scaled(
-                self.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+            # Scale pixmap to fit window while keeping aspect ratio. It is scaled
+            # to device pixels, so painting is a 1:1 blit even on high-DPI screens
+            dpr = self.devicePixelRatioF()
+            scaled_pixmap, scaled_key = self.scaled_background or (None, None)
+            if scaled_key != (self.size(), dpr):
+                scaled_pixmap = self.background_pixmap.scaled(
+                    self.size() * dpr,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                )
+                scaled_pixmap.setDevicePixelRatio(dpr)
+                self.scaled_background = (scaled_pixmap, (self.size(), dpr))
             
             # Calculate position to center the scaled image
-            x = (self.width() - scaled_pixmap.width()) // 2
-            y = (self.height() - scaled_pixmap.height()) // 2
+            scaled_size = scaled_pixmap.deviceIndependentSize().toSize()
+            x = (self.width() - scaled_size.width()) // 2
+            y = (self.height() - scaled_size.height()) // 2
             
             painter.drawPixmap(x, y, scaled_pixmap)
 
+    def update_background(self):
+        """Repaints the window only when the background image appears or disappears."""
+        visible = self.background_pixmap is not None and self.tabs.count() == 0
+        if visible != self.background_visible:
+            self.background_visible = visible
+            self.update()
+
     def create_toolbar(self, layout):
         """Creates the toolbar with buttons and controls."""
         # File operations
@@ -142,6 +208,13 @@ class PDFViewer(QMainWindow):
         self.btn_save_as.clicked.connect(self.save_current_tab_as)
         layout.addWidget(self.btn_save_as)
         
+        self.btn_optimize_save = QPushButton("Optimize && Save As...")
+        self.btn_optimize_save.setToolTip("Save a size-optimized copy (Ctrl+Alt+S)\n"
+                                          "Merges duplicate objects and cleans page content; "
+                                          "can take much longer than a regular save on large documents")
+        self.btn_optimize_save.clicked.connect(self.optimize_and_save_current_tab_as)
+        layout.addWidget(self.btn_optimize_save)
+        
         layout.addStretch(1)
         
         # Search button
@@ -217,6 +290,21 @@ class PDFViewer(QMainWindow):
         btn_about.setToolTip("About FreeBird PDF")
         btn_about.clicked.connect(self.show_about_dialog)
         layout.addWidget(btn_about)
+        
+        # Document state each control needs to be enabled (see refresh_button_states)
+        self.button_state_rules = [
+            (self.btn_save, "can_save"),
+            (self.btn_save_as, "valid"),
+            (self.btn_optimize_save, "valid"),
+            (self.btn_delete_page, "can_delete"),
+            (self.btn_reorder_pages, "can_reorder"),
+            (self.btn_prev, "can_go_prev"),
+            (self.btn_next, "can_go_next"),
+            (self.zoom_spinbox, "valid"),
+            (self.goto_page_input, "can_goto"),
+            (self.btn_goto, "can_goto"),
+            (self.btn_search, "valid"),
+        ]
 
     def create_actions(self):
         """Creates QActions for keyboard shortcuts."""
@@ -284,24 +372,48 @@ class PDFViewer(QMainWindow):
         self.save_as_action.setShortcut(QKeySequence.StandardKey.SaveAs)
         self.save_as_action.triggered.connect(self.save_current_tab_as)
         self.addAction(self.save_as_action)
+        
+        # Optimize and Save As shortcut (Ctrl+Alt+S)
+        self.optimize_save_action = QAction("Optimize and Save As...", self)
+        self.optimize_save_action.setShortcut(QKeySequence("Ctrl+Alt+S"))
+        self.optimize_save_action.triggered.connect(self.optimize_and_save_current_tab_as)
+        self.addAction(self.optimize_save_action)
+        
+        # Compact Memory shortcut (Ctrl+Shift+M)
+        self.compact_memory_action = QAction("Compact Memory", self)
+        self.compact_memory_action.setShortcut(QKeySequence("Ctrl+Shift+M"))
+        self.compact_memory_action.triggered.connect(self.compact_memory)
+        self.addAction(self.compact_memory_action)
 
     def get_current_view_widget(self):
         """Gets the PDFViewWidget from the currently active tab."""
         return self.tabs.currentWidget()
 
+    def ensure_search_panel(self):
+        """Returns the search panel, creating it below the toolbar on first use."""
+        if self.search_panel is None:
+            self.search_panel = SearchPanel(self)
+            self.search_panel.hide()
+            self.container_layout.insertWidget(1, self.search_panel)
+        return self.search_panel
+
+    def is_search_panel_visible(self):
+        """Whether the search panel exists and is shown."""
+        return self.search_panel is not None and self.search_panel.isVisible()
+
     def toggle_search_panel(self):
         """Toggle the search panel visibility."""
-        if not self.search_panel.isVisible():
+        if not self.is_search_panel_visible():
             # Only show if we have a valid PDF document
             current_widget = self.get_current_view_widget()
             if current_widget and isinstance(current_widget, PDFViewWidget) and current_widget.doc:
-                self.search_panel.show_panel()
+                self.ensure_search_panel().show_panel()
         else:
             self.search_panel.hide()
             
     def find_next(self):
         """Find next search result."""
-        if self.search_panel.isVisible():
+        if self.is_search_panel_visible():
             self.search_panel.on_next()
         else:
             # Show search panel if it's not visible
@@ -309,7 +421,7 @@ class PDFViewer(QMainWindow):
             
     def find_previous(self):
         """Find previous search result."""
-        if self.search_panel.isVisible():
+        if self.is_search_panel_visible():
             self.search_panel.on_previous()
         else:
             # Show search panel if it's not visible
@@ -317,24 +429,28 @@ class PDFViewer(QMainWindow):
 
     def open_files(self):
         """Opens one or more PDF files, each in a new tab."""
+        # Skip per-entry symlink resolution and custom folder icon lookups,
+        # which are slow on network drives
         file_paths, _ = QFileDialog.getOpenFileNames(
-            self, "Open PDF File(s)", "", "PDF Files (*.pdf);;All Files (*)"
+            self, "Open PDF File(s)", "", "PDF Files (*.pdf);;All Files (*)",
+            options=QFileDialog.Option.DontResolveSymlinks | QFileDialog.Option.DontUseCustomDirectoryIcons
         )
         
         opened_count = 0
         first_new_index = -1
         
+        # Files already open, by path; built per call, since Save As changes a tab's path
+        open_widgets = {}
+        for i in range(self.tabs.count()):
+            widget = self.tabs.widget(i)
+            if isinstance(widget, PDFViewWidget) and widget.get_filepath():
+                open_widgets.setdefault(widget.get_filepath(), widget)
+        
         for file_path in file_paths:
             # Check if already open
-            already_open_index = -1
-            for i in range(self.tabs.count()):
-                widget = self.tabs.widget(i)
-                if isinstance(widget, PDFViewWidget) and widget.get_filepath() == file_path:
-                    already_open_index = i
-                    break
-                    
-            if already_open_index != -1:
-                self.tabs.setCurrentIndex(already_open_index)
+            already_open_widget = open_widgets.get(file_path)
+            if already_open_widget is not None:
+                self.tabs.setCurrentWidget(already_open_widget)
                 continue
                 
             # Create new view widget
@@ -345,6 +461,7 @@ class PDFViewer(QMainWindow):
                 filename = os.path.basename(file_path)
                 index = self.tabs.addTab(view_widget, filename)
                 self.tabs.setTabToolTip(index, file_path)
+                open_widgets[file_path] = view_widget
                 
                 if first_new_index == -1:
                     first_new_index = index
@@ -360,7 +477,26 @@ class PDFViewer(QMainWindow):
             print("No files opened successfully.")
             
         # Trigger repaint for background if needed
-        self.update()
+        self.update_background()
+
+    def ask_question(self, title, text, buttons, default_button):
+        """
+        Asks a question like QMessageBox.question and returns the button clicked.
+        
+        One message box is created on first use and reconfigured for each
+        question, so the style and icon lookups happen only once.
+        """
+        if self.confirm_box is None:
+            self.confirm_box = QMessageBox(self)
+            self.confirm_box.setIcon(QMessageBox.Icon.Question)
+        self.confirm_box.setWindowTitle(title)
+        self.confirm_box.setText(text)
+        self.confirm_box.setStandardButtons(buttons)
+        self.confirm_box.setDefaultButton(default_button)
+        self.confirm_box.setEscapeButton(default_button)
+        self.confirm_box.exec()
+        clicked = self.confirm_box.clickedButton()
+        return self.confirm_box.standardButton(clicked) if clicked is not None else default_button
 
     def close_tab(self, index):
         """Handles the request to close a tab."""
@@ -373,8 +509,8 @@ class PDFViewer(QMainWindow):
         # Check for unsaved changes
         if widget_to_close.is_document_modified():
             filename = self.tabs.tabText(index).replace("*", "")
-            reply = QMessageBox.question(
-                self, 'Unsaved Changes',
+            reply = self.ask_question(
+                'Unsaved Changes',
                 f"'{filename}' has changes. Save before closing?",
                 QMessageBox.StandardButton.Save | QMessageBox.StandardButton.Discard | QMessageBox.StandardButton.Cancel,
                 QMessageBox.StandardButton.Cancel
@@ -394,13 +530,17 @@ class PDFViewer(QMainWindow):
         self.tabs.removeTab(index)
         
         # Hide search panel if no tabs
-        if self.tabs.count() == 0 and self.search_panel.isVisible():
+        if self.tabs.count() == 0 and self.is_search_panel_visible():
             self.search_panel.hide()
         
         # Trigger repaint for background if needed
-        self.update()
+        self.update_background()
 
     def update_ui_for_current_tab(self, index=-1):
+        """Schedules refresh_ui_for_current_tab; repeated calls before it runs are merged."""
+        self._ui_update_timer.start()
+
+    def refresh_ui_for_current_tab(self):
         """Updates UI elements to reflect the current tab's state."""
         current_widget = self.get_current_view_widget()
         
@@ -422,13 +562,13 @@ class PDFViewer(QMainWindow):
             self.btn_search.setEnabled(True)
             
             # Update search panel if visible
-            if self.search_panel.isVisible():
+            if self.is_search_panel_visible():
                 search_results = current_widget.get_search_results()
                 if search_results.has_results():
                     self.search_panel.search_input.setText(search_results.query)
                     self.search_panel.update_ui_state(True)
                     self.search_panel.status_label.setText(f"{search_results.get_current_match_info()}")
-                else:
+                elif not current_widget.is_search_running():
                     # Clear search panel
                     self.search_panel.search_input.clear()
                     self.search_panel.update_ui_state(False)
@@ -445,80 +585,52 @@ class PDFViewer(QMainWindow):
             self.btn_search.setEnabled(False)
             
             # Hide search panel if visible
-            if self.search_panel.isVisible():
+            if self.is_search_panel_visible():
                 self.search_panel.hide()
             
-        # Update button states
-        self.update_button_states()
+        # Update button states (this pass covers any pending button refresh)
+        self._button_update_timer.stop()
+        self.refresh_button_states()
         
-        # Trigger repaint
-        self.update()
+        # Trigger repaint for background if needed
+        self.update_background()
 
     def update_button_states(self):
+        """Schedules refresh_button_states; repeated calls before it runs are merged."""
+        if not self._ui_update_timer.isActive():
+            self._button_update_timer.start()
+
+    def refresh_button_states(self):
+        """Enables the toolbar controls that apply to the current tab's document."""
         current_widget = self.get_current_view_widget()
-        has_valid_widget_check = current_widget and isinstance(current_widget, PDFViewWidget) and current_widget.doc
-        is_widget_valid_bool = bool(has_valid_widget_check)
+        is_widget_valid_bool = bool(current_widget and isinstance(current_widget, PDFViewWidget) and current_widget.doc)
         
         if is_widget_valid_bool:
             page, total = current_widget.get_current_page_info()
             valid_page_index = 0 <= page < total
-            can_go_prev = valid_page_index and page > 0
-            can_go_next = valid_page_index and page < total - 1
-            can_delete = total > 1
-            can_reorder = total > 1
-            is_modified = current_widget.is_document_modified()
-            can_goto = total > 0
-            has_path = current_widget.get_filepath() and not current_widget.get_filepath().startswith(ASSEMBLY_PREFIX)
+            states = {
+                "valid": True,
+                "can_save": current_widget.is_document_modified(),
+                "can_go_prev": valid_page_index and page > 0,
+                "can_go_next": valid_page_index and page < total - 1,
+                "can_delete": total > 1,
+                "can_reorder": total > 1,
+                "can_goto": total > 0,
+            }
         else:
-            can_go_prev = False
-            can_go_next = False
-            can_delete = False
-            can_reorder = False
-            is_modified = False
-            can_goto = False
-            has_path = False
-        
-        # CRITICAL: Check if each button exists before setting its state
-        if hasattr(self, 'btn_save') and self.btn_save is not None:
-            self.btn_save.setEnabled(is_widget_valid_bool and is_modified)
-            
-        if hasattr(self, 'btn_save_as') and self.btn_save_as is not None:
-            self.btn_save_as.setEnabled(is_widget_valid_bool)
+            states = dict.fromkeys(("valid", "can_save", "can_go_prev", "can_go_next",
+                                    "can_delete", "can_reorder", "can_goto"), False)
         
-        if hasattr(self, 'btn_delete_page') and self.btn_delete_page is not None:
-            self.btn_delete_page.setEnabled(is_widget_valid_bool and can_delete)
-        
-        if hasattr(self, 'btn_reorder_pages') and self.btn_reorder_pages is not None:
-            self.btn_reorder_pages.setEnabled(is_widget_valid_bool and can_reorder)
-            
-        if hasattr(self, 'btn_prev') and self.btn_prev is not None:
-            self.btn_prev.setEnabled(is_widget_valid_bool and can_go_prev)
-        
-        if hasattr(self, 'btn_next') and self.btn_next is not None:
-            self.btn_next.setEnabled(is_widget_valid_bool and can_go_next)
-        
-        if hasattr(self, 'zoom_spinbox') and self.zoom_spinbox is not None:
-            self.zoom_spinbox.setEnabled(is_widget_valid_bool)
-        
-        if hasattr(self, 'goto_page_input') and self.goto_page_input is not None:
-            self.goto_page_input.setEnabled(is_widget_valid_bool and can_goto)
-        
-        if hasattr(self, 'btn_goto') and self.btn_goto is not None:
-            self.btn_goto.setEnabled(is_widget_valid_bool and can_goto)
-            
-        if hasattr(self, 'btn_search') and self.btn_search is not None:
-            self.btn_search.setEnabled(is_widget_valid_bool)
-            
-        # If we have a sign button (for signatures), update it too
-        if hasattr(self, 'btn_sign') and self.btn_sign is not None:
-            self.btn_sign.setEnabled(is_widget_valid_bool)
+        for control, state in self.button_state_rules:
+            control.setEnabled(bool(states[state]))
 
     def show_about_dialog(self):
         """Show the About dialog."""
-        dialog = AboutDialog(self)
-        dialog.exec()
+        if self.about_dialog is None:
+            self.about_dialog = AboutDialog(self)
+        self.about_dialog.exec()
 
-    def save_current_tab_as(self, checked=None, *, index=None):
+    def save_current_tab_as(self, checked=None, *, index=None, optimize=False):
         """Saves the document in the specified tab index, or the current tab if index is None."""
         widget_to_save = None
         
@@ -533,7 +645,7 @@ class PDFViewer(QMainWindow):
         # Proceed only if we successfully identified a valid widget
         if widget_to_save and isinstance(widget_to_save, PDFViewWidget):
             suggested_dir = ""
-            success = widget_to_save.save_as(suggested_dir)
+            success = widget_to_save.save_as(suggested_dir, optimize)
             
             if success and widget_to_save is self.get_current_view_widget():
                 self.update_button_states()
@@ -542,6 +654,15 @@ class PDFViewer(QMainWindow):
         else:
             print("Save Error: No valid document selected/found to save.")
             return False
+    
+    def optimize_and_save_current_tab_as(self):
+        """Saves a size-optimized copy of the current tab's document."""
+        return self.save_current_tab_as(optimize=True)
+            
+    def compact_memory(self):
+        """Frees MuPDF's cached objects for all open documents."""
+        shrink_mupdf_store()  # The store is shared, so one call covers every tab
+        print("Compacted MuPDF memory.")
             
     def save_current_document(self):
         """Save the current document (if it has been modified and has a path)."""
@@ -554,7 +675,7 @@ class PDFViewer(QMainWindow):
             if current_widget.get_filepath() and not current_widget.get_filepath().startswith(ASSEMBLY_PREFIX):
                 try:
                     # Save to the existing path
-                    current_widget.doc.save(current_widget.get_filepath(), garbage=4, deflate=True)
+                    save_pdf(current_widget.doc, current_widget.get_filepath())
                     current_widget.mark_modified(False)
                     print(f"Saved document to {current_widget.get_filepath()}")
                     return True
@@ -590,8 +711,8 @@ class PDFViewer(QMainWindow):
         
         print(f"Created new assembly tab: {assembly_name}")
         
-        # Trigger repaint
-        self.update()
+        # Trigger repaint for background if needed
+        self.update_background()
 
     def show_reorder_dialog(self):
         """Show the thumbnail view dialog for reordering pages."""
@@ -710,8 +831,7 @@ class PDFViewer(QMainWindow):
         # Prompt to save unsaved changes
         if modified_tabs_names:
             filenames = "\n - ".join(modified_tabs_names)
-            reply = QMessageBox.question(
-                self, 
+            reply = self.ask_question(
                 'Unsaved Changes', 
                 f"Documents have unsaved changes:\n - {filenames}\n\nQuit without saving?",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
@@ -732,5 +852,6 @@ class PDFViewer(QMainWindow):
             widget = self.tabs.widget(i)
             if isinstance(widget, PDFViewWidget):
                 widget.close_document()
+        shutdown_render_executor()
                     
         event.accept()
\ No newline at end of file
@@ -1,18 +1,50 @@
 # freebird/ui/pdf_view.py
 
 import os
+import math
+import time
+import bisect
+import threading
+import weakref
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict
 import fitz  # PyMuPDF
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QScrollArea, QMessageBox, 
     QHBoxLayout, QDialog, QMenu, QFileDialog
 )
 from PyQt6.QtGui import (
-    QPixmap, QImage, QPainter, QColor, QPen, QAction
+    QPixmap, QPixmapCache, QImage, QPainter, QColor, QPen, QAction
+)
+from PyQt6.QtCore import (
+    Qt, QRect, QRectF, QSize, QBuffer, QEvent, QObject, QTimer, pyqtSignal
 )
-from PyQt6.QtCore import Qt, QRect, QBuffer
 
 from freebird.constants import ASSEMBLY_PREFIX
-from freebird.utils.helpers import show_message
+from freebird.utils.helpers import show_message, open_pdf_file, save_pdf, shrink_mupdf_store
+
+# Delay after the last zoom step before the page is rasterized at the new zoom
+ZOOM_SETTLE_MS = 150
+
+# Page changes within one frame of each other are drawn once, for the last page
+DISPLAY_DEBOUNCE_MS = 16
+
+# Pages larger than this many pixels at the current zoom are rendered as tiles
+TILED_PAGE_MIN_PIXELS = 4096 * 4096
+PAGE_TILE_SIZE = 512
+
+# While a page renders in the background, a render at 1/N of the zoom is shown
+LOW_RES_PREVIEW_DIVISOR = 4
+
+# Number of recently rendered pages whose parsed content is kept for re-rendering
+DISPLAY_LIST_CACHE_SIZE = 4
+
+# Completed searches remembered per document for repeating them instantly
+SEARCH_CACHE_SIZE = 16
+
+# A running search gives the event loop a turn after this long
+SEARCH_SLICE_MS = 15
 
 # ============================================================
 #  SearchResult: Class to store search results
@@ -27,11 +59,26 @@ class SearchResult:
         self.total_matches = 0
         self.current_page = -1
         self.current_match = -1
+        self._invalidate_index()
+    
+    def _invalidate_index(self):
+        # Lazily rebuilt flat list of every match, in document order
+        self._flat = None  # [(page_index, match_index), ...]
+        self._flat_pos = -1  # position of the current match in _flat
+    
+    def _build_index(self):
+        if self._flat is not None:
+            return
+        self._flat = [(page, k) for page in sorted(self.results) for k in range(len(self.results[page]))]
+        current = (self.current_page, self.current_match)
+        pos = bisect.bisect_left(self._flat, current)
+        self._flat_pos = pos if pos < len(self._flat) and self._flat[pos] == current else -1
     
     def add_matches(self, page_index, rects):
         if rects:
             self.results[page_index] = rects
             self.total_matches += len(rects)
+            self._invalidate_index()
     
     def has_results(self):
         return self.total_matches > 0
@@ -44,17 +91,8 @@ class SearchResult:
         if not self.has_results() or self.current_match < 0 or self.current_page < 0:
             return -1
         
-        count = 0
-        pages = sorted(self.results.keys())
-        
-        for page in pages:
-            if page < self.current_page:
-                count += len(self.results[page])
-            elif page == self.current_page:
-                count += self.current_match
-                break
-        
-        return count
+        self._build_index()
+        return self._flat_pos
     
     def get_current_match_info(self):
         if self.has_results() and self.current_match >= 0:
@@ -66,69 +104,346 @@ class SearchResult:
         if not self.has_results():
             return None, -1
         
-        pages = sorted(self.results.keys())
-        if not pages:
+        self._build_index()
+        if not self._flat:
             return None, -1
         
-        # First search or reset
-        if self.current_page < 0 or self.current_match < 0:
-            self.current_page = pages[0]
-            self.current_match = 0
-            return self.current_page, self.results[self.current_page][self.current_match]
-        
-        # Navigate forward
-        if forward:
-            # Move to next match on current page
-            if self.current_match + 1 < len(self.results[self.current_page]):
-                self.current_match += 1
-            else:
-                # Move to next page
-                current_page_index = pages.index(self.current_page)
-                if current_page_index + 1 < len(pages):
-                    self.current_page = pages[current_page_index + 1]
-                    self.current_match = 0
-                else:
-                    # Wrap around to first result
-                    self.current_page = pages[0]
-                    self.current_match = 0
-        # Navigate backward
+        # First search or reset starts at the first match; otherwise step and wrap
+        if self._flat_pos < 0:
+            pos = 0
         else:
-            # Move to previous match on current page
-            if self.current_match > 0:
-                self.current_match -= 1
-            else:
-                # Move to previous page
-                current_page_index = pages.index(self.current_page)
-                if current_page_index > 0:
-                    self.current_page = pages[current_page_index - 1]
-                    self.current_match = len(self.results[self.current_page]) - 1
-                else:
-                    # Wrap around to last result
-                    self.current_page = pages[-1]
-                    self.current_match = len(self.results[self.current_page]) - 1
-        
+            pos = (self._flat_pos + (1 if forward else -1)) % len(self._flat)
+        self._flat_pos = pos
+        self.current_page, self.current_match = self._flat[pos]
         return self.current_page, self.results[self.current_page][self.current_match]
 
+def render_page_image(page, zoom, clip=None, dpr=1.0):
+    """
+    Rasterizes a page or its fitz.DisplayList (or the clip of it) into a QImage in Qt's native
+    32-bit format, so QPixmap.fromImage(..., NoFormatConversion) can take it
+    as is. MuPDF only emits packed RGB for opaque output; one explicit
+    RGB888 -> RGB32 pass is cheaper than the conversion fromImage() picks.
+    
+    The page is rendered at zoom * dpr device pixels and the image tagged
+    with dpr, so on high-DPI screens Qt draws it 1:1 instead of upscaling.
+    """
+    matrix = fitz.Matrix(zoom * dpr, zoom * dpr)
+    if clip is None:
+        pix = page.get_pixmap(matrix=matrix, alpha=False)
+    else:
+        pix = page.get_pixmap(matrix=matrix, clip=clip, alpha=False)
+    return page_image_from_samples(pix.samples_mv, pix.width, pix.height, pix.stride, dpr)
+
+def page_image_from_samples(samples, width, height, stride, dpr=1.0):
+    """Builds a render_page_image() style QImage from raw RGB samples."""
+    # The converted copy no longer references the sample buffer
+    qimage = QImage(samples, width, height, stride,
+                    QImage.Format.Format_RGB888).convertToFormat(QImage.Format.Format_RGB32)
+    qimage.setDevicePixelRatio(dpr)
+    return qimage
+
+def pixmap_from_page_image(qimage):
+    """QPixmap for an image from render_page_image(), without another conversion."""
+    return QPixmap.fromImage(qimage, Qt.ImageConversionFlag.NoFormatConversion)
+
+# ============================================================
+#  Background page rendering
+# ============================================================
+# PyMuPDF holds the GIL while rasterizing, so a render thread would stall the
+# GUI as much as rendering on it. Pages of saved documents are rendered in a
+# worker process instead, shared by all views, which keeps the last few files
+# it has opened and reopens one whose modification time has changed.
+RENDER_WORKER_DOCUMENTS = 4
+
+_worker_documents = OrderedDict()  # In the worker: {path: (mtime, fitz.Document)}
+
+def _worker_document(path):
+    """Returns the worker's document for a file, opening it on first use or after it changed."""
+    mtime = os.path.getmtime(path)
+    entry = _worker_documents.pop(path, None)
+    if entry is not None and entry[0] != mtime:
+        entry[1].close()
+        entry = None
+    if entry is None:
+        entry = (mtime, open_pdf_file(path))
+    _worker_documents[path] = entry
+    while len(_worker_documents) > RENDER_WORKER_DOCUMENTS:
+        _, (_, doc) = _worker_documents.popitem(last=False)
+        doc.close()
+    return entry[1]
+
+def _render_page_samples(path, page_index, zoom, dpr):
+    """Worker task: renders one page and returns its raw RGB samples."""
+    page = _worker_document(path).load_page(page_index)
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom * dpr, zoom * dpr), alpha=False)
+    return pix.samples, pix.width, pix.height, pix.stride
+
+def _release_worker_document(path):
+    """Worker task: closes the worker's document for a file, if it has one."""
+    entry = _worker_documents.pop(path, None)
+    if entry is not None:
+        entry[1].close()
+
+_render_executor = None
+_render_executor_ready = threading.Event()
+
+def get_render_executor():
+    """
+    Returns the shared render process pool once its worker is up, otherwise
+    None. The first call starts the worker; until it has finished starting
+    (importing Qt and MuPDF takes a while), pages are rendered in the GUI
+    process rather than waiting for it.
+    """
+    global _render_executor
+    if _render_executor is None:
+        _render_executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+        _render_executor.submit(os.getpid).add_done_callback(lambda future: _render_executor_ready.set())
+    return _render_executor if _render_executor_ready.is_set() else None
+
+def shutdown_render_executor():
+    """Stops the render worker process; renders still queued are dropped."""
+    global _render_executor
+    if _render_executor is not None:
+        _render_executor.shutdown(wait=False, cancel_futures=True)
+        _render_executor = None
+        _render_executor_ready.clear()
+
+class RenderSignals(QObject):
+    """Carries finished renders from executor callbacks to the GUI thread."""
+    # generation, request id (0 for prefetch), page index, zoom, dpr, (samples, width, height, stride) or None
+    page_rendered = pyqtSignal(int, int, int, float, float, object)
+
+# ============================================================
+#  PageLabel: Displays the page, as one pixmap or as tiles
+# ============================================================
+class PageLabel(QLabel):
+    """
+    Page label that can also draw very large pages tile by tile.
+    
+    In tiled mode the label holds no pixmap; it takes the full page size and
+    paints only the PAGE_TILE_SIZE tiles intersecting the exposed area,
+    fetched through tile_source(tx, ty) -> QPixmap or None.
+    """
+    
+    def __init__(self, text=""):
+        super().__init__(text)
+        self.tiled_size = None
+        self.tile_source = None
+        self.shown_key = None  # set by the view to identify the complete render on display
+        self.fitted_size = None  # page size the label was last sized for
+    
+    def set_tiled_page(self, size, tile_source):
+        self.shown_key = None
+        super().setPixmap(QPixmap())
+        self.tiled_size = size
+        self.tile_source = tile_source
+        self.setMinimumSize(size)
+        self.update()
+    
+    def leave_tiled_mode(self):
+        if self.tiled_size is not None:
+            self.tiled_size = None
+            self.tile_source = None
+            self.setMinimumSize(0, 0)
+    
+    def setPixmap(self, pixmap):
+        self.leave_tiled_mode()
+        self.shown_key = None
+        super().setPixmap(pixmap)
+    
+    def setText(self, text):
+        self.leave_tiled_mode()
+        self.shown_key = None
+        super().setText(text)
+    
+    def page_size(self):
+        """Size of the page shown, in device-independent pixels, or None if showing text."""
+        if self.tiled_size is not None:
+            return self.tiled_size
+        pixmap = self.pixmap()
+        if pixmap is None or pixmap.isNull():
+            return None
+        return pixmap.deviceIndependentSize().toSize()
+    
+    def fit_to_contents(self):
+        """
+        Resizes the label to its contents, unless it already fits a page of
+        this size; re-rendering or previewing at the same size then costs
+        no layout pass through the scroll area.
+        """
+        size = self.page_size()
+        if size is not None and size == self.fitted_size:
+            return
+        self.fitted_size = size
+        self.adjustSize()
+    
+    def page_rect(self):
+        """Where the page is drawn, in label coordinates (null if no page is shown)."""
+        size = self.page_size()
+        if size is None:
+            return QRect()
+        width, height = size.width(), size.height()
+        # The label centers the page, so offset by the margin around it
+        return QRect((self.width() - width) // 2, (self.height() - height) // 2, width, height)
+    
+    def paintEvent(self, event):
+        if self.tiled_size is None:
+            super().paintEvent(event)
+            return
+        
+        page_rect = self.page_rect()
+        exposed = event.rect().intersected(page_rect)
+        if exposed.isEmpty():
+            return
+        
+        first_tx = (exposed.left() - page_rect.left()) // PAGE_TILE_SIZE
+        last_tx = (exposed.right() - page_rect.left()) // PAGE_TILE_SIZE
+        first_ty = (exposed.top() - page_rect.top()) // PAGE_TILE_SIZE
+        last_ty = (exposed.bottom() - page_rect.top()) // PAGE_TILE_SIZE
+        
+        painter = QPainter(self)
+        for ty in range(first_ty, last_ty + 1):
+            for tx in range(first_tx, last_tx + 1):
+                tile = self.tile_source(tx, ty)
+                if tile is not None:
+                    painter.drawPixmap(page_rect.left() + tx * PAGE_TILE_SIZE,
+                                       page_rect.top() + ty * PAGE_TILE_SIZE, tile)
+        painter.end()
+
+# ============================================================
+#  HighlightOverlay: Search highlights drawn over the page image
+# ============================================================
+class HighlightOverlay(QWidget):
+    """
+    Transparent widget stacked on the page label that paints search highlights.
+    
+    Keeping highlights out of the rendered pixmap means the cached page can be
+    reused as-is; moving between matches only repaints this overlay.
+    """
+    
+    def __init__(self, label):
+        super().__init__(label)
+        self.label = label
+        self.rects = []  # match rects (QRectF) in PDF coordinates
+        self.current_index = -1
+        self.zoom = 1.0
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.resize(label.size())
+    
+    def set_highlights(self, rects, current_index, zoom):
+        same_matches = rects is self.rects and zoom == self.zoom
+        previous_index = self.current_index
+        self.rects = rects
+        self.current_index = current_index
+        self.zoom = zoom
+        
+        if not same_matches:
+            self.update()
+        elif current_index != previous_index:
+            # Only the old and new current match change appearance
+            for index in (previous_index, current_index):
+                self.update_match(index)
+    
+    def match_widget_rect(self, index):
+        """Area of the overlay covered by match index, including the current match's border."""
+        if not (0 <= index < len(self.rects)):
+            return QRect()
+        rect = self.rects[index]
+        scaled = QRectF(rect.topLeft() * self.zoom, rect.size() * self.zoom).toAlignedRect()
+        return scaled.translated(self.label.page_rect().topLeft()).adjusted(-2, -2, 2, 2)
+    
+    def update_match(self, index):
+        rect = self.match_widget_rect(index)
+        if not rect.isNull():
+            self.update(rect)
+    
+    def paintEvent(self, event):
+        page_rect = self.label.page_rect()
+        if not self.rects or page_rect.isNull():
+            return
+        
+        # Matches stay in PDF coordinates; the painter scales them by the zoom
+        painter = QPainter(self)
+        painter.translate(page_rect.topLeft())
+        painter.scale(self.zoom, self.zoom)
+        
+        # Only matches inside the repainted area are drawn; at high zoom
+        # most of the overlay is scrolled out of view
+        exposed = painter.worldTransform().inverted()[0].mapRect(QRectF(event.rect()))
+        
+        # Yellow for other matches
+        other_color = QColor(255, 255, 0, 100)
+        for i, rect in enumerate(self.rects):
+            if i != self.current_index and rect.intersects(exposed):
+                painter.fillRect(rect, other_color)
+        
+        # Orange highlight with a red-orange border for the current match
+        if 0 <= self.current_index < len(self.rects):
+            pen = QPen(QColor(255, 69, 0), 2)
+            pen.setCosmetic(True)  # 2 pixels wide at any zoom
+            painter.setPen(pen)
+            painter.setBrush(QColor(255, 165, 0, 100))
+            painter.drawRect(self.rects[self.current_index])
+        painter.end()
+
 # ============================================================
 #  PDFViewWidget: Widget to display a single PDF document
 # ============================================================
 class PDFViewWidget(QWidget):
+    # Emitted as background search results arrive and when the search finishes
+    search_updated = pyqtSignal()
+    
     def __init__(self, filepath=None, parent=None, is_assembly=False):
         super().__init__(parent)
         self.doc = None
         self.current_filepath = None
         self.current_page = 0
-        self.total_pages = 0
         self.zoom_factor = 1.0
         self.is_modified = False
-        self.pixmap_cache = {}
+        # Keys into the shared QPixmapCache with the pixmap's size in bytes, least recently used first
+        self.pixmap_cache = OrderedDict()  # {(page_index, zoom): (QPixmapCache.Key, nbytes)}
+        self.tile_cache = OrderedDict()  # {(page_index, zoom, tx, ty): (QPixmapCache.Key, nbytes)} for tiled pages
+        self.thumb_cache = OrderedDict()  # {page_index: (QPixmapCache.Key, nbytes)} of reorder dialog thumbnails
+        self._page_text_cache = {}  # {(page_index, search flags): lowercased extracted text} for search
+        self._search_cache = {}  # {(query, flags): {page_index: [rects]}} of completed searches
         self._is_assembly_target = is_assembly
+        self._tab_widget = None  # Containing QTabWidget, found on first use
+        self._assembly_widget_ref = None  # weakref to the assembly tab last found by find_assembly_widget
         self._update_in_progress = False  # Flag to prevent update loops
+        self._display_pending = False  # display_page() was skipped while hidden
         
         # Search-related attributes
         self.search_results = SearchResult()
         self.highlight_rects = []
         self.current_highlight_rect = None
+        self._search_key = None  # (query, flags) of the latest search
+        self._search_terms = []  # lowercased words of the query, for the page text prefilter
+        self._search_next_page = 0  # next page the running search looks at
+        
+        # A running search works through the pages in slices between events
+        self._search_timer = QTimer(self)
+        self._search_timer.setInterval(0)
+        self._search_timer.timeout.connect(self._search_step)
+        self._doc_snapshot = None  # PDF bytes of the modified document for workers
+        self._render_generation = 0  # bumped when page indices or content change
+        self._prefetch_pending = set()  # (page_index, zoom) being rendered ahead
+        self._render_signals = RenderSignals()
+        self._render_signals.page_rendered.connect(self._on_page_rendered)
+        self._render_request_id = 0  # latest page the view is waiting for
+        self._render_futures = []  # renders submitted to the worker process, dropped when no longer wanted
+        self._display_lists = OrderedDict()  # {page_index: fitz.DisplayList}, least recently used first
+        
+        # Re-renders the page once zooming pauses; until then a scaled preview is shown
+        self._zoom_settle_timer = QTimer(self)
+        self._zoom_settle_timer.setSingleShot(True)
+        self._zoom_settle_timer.setInterval(ZOOM_SETTLE_MS)
+        self._zoom_settle_timer.timeout.connect(self.display_page)
+        
+        # Coalesces bursts of navigation into one display of the final page
+        self._display_timer = QTimer(self)
+        self._display_timer.setSingleShot(True)
+        self._display_timer.setInterval(DISPLAY_DEBOUNCE_MS)
+        self._display_timer.timeout.connect(self.display_page)
         
         self.init_ui()
         
@@ -145,24 +460,60 @@ class PDFViewWidget(QWidget):
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
         
-        self.image_label = QLabel("Loading...")
+        self.image_label = PageLabel("Loading...")
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.image_label.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.image_label.customContextMenuRequested.connect(self.show_context_menu)
+        self.create_context_menu()
+        
+        # Search highlights are painted on an overlay that tracks the label's size
+        self.highlight_overlay = HighlightOverlay(self.image_label)
+        self.image_label.installEventFilter(self)
         
         self.scroll_area.setWidget(self.image_label)
         layout.addWidget(self.scroll_area)
 
+    def create_context_menu(self):
+        """Creates the right-click menu and its actions once; show_context_menu only refills it."""
+        self.context_menu = QMenu(self)
+        
+        self.add_current_action = QAction("Add Page to Assembly", self)
+        self.add_current_action.triggered.connect(self.add_current_page_to_assembly)
+        
+        self.add_all_action = QAction("Add All Pages to Assembly", self)
+        self.add_all_action.triggered.connect(self.add_all_pages_to_assembly)
+        
+        self.move_up_action = QAction("Move Page Up", self)
+        self.move_up_action.triggered.connect(self.move_current_page_up)
+        
+        self.move_down_action = QAction("Move Page Down", self)
+        self.move_down_action.triggered.connect(self.move_current_page_down)
+        
+        self.move_to_action = QAction("Move Page To...", self)
+        self.move_to_action.triggered.connect(self.show_move_page_dialog)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._display_pending:
+            self.display_page()
+
+    def eventFilter(self, obj, event):
+        if obj is self.image_label and event.type() == QEvent.Type.Resize:
+            self.highlight_overlay.resize(event.size())
+        return super().eventFilter(obj, event)
+
     def setup_assembly_doc(self, name):
         """Initializes this widget with a new empty document for assembly."""
         self.close_document()
         self.doc = fitz.open()
         self.current_filepath = ASSEMBLY_PREFIX + name
-        self.total_pages = 0
         self.current_page = 0
         self.zoom_factor = 1.0
         self.is_modified = False
-        self.pixmap_cache = {}
+        self.clear_pixmap_cache()
+        self.clear_thumbnail_cache()
+        self._page_text_cache = {}
+        self._search_cache = {}
         self._is_assembly_target = True
         self.search_results.reset()
         self.display_page()
@@ -175,13 +526,15 @@ class PDFViewWidget(QWidget):
             
         try:
             self.close_document()
-            self.doc = fitz.open(filepath)
+            self.doc = open_pdf_file(filepath)
             self.current_filepath = filepath
-            self.total_pages = len(self.doc)
             self.current_page = 0
             self.zoom_factor = 1.0
             self.is_modified = False
-            self.pixmap_cache = {}
+            self.clear_pixmap_cache()
+            self.clear_thumbnail_cache()
+            self._page_text_cache = {}
+            self._search_cache = {}
             self.search_results.reset()
             
             if self.total_pages > 0:
@@ -192,19 +545,158 @@ class PDFViewWidget(QWidget):
         except Exception as e:
             self.doc = None
             self.current_filepath = None
-            self.total_pages = 0
             self.image_label.setText(f"Error opening file:\n{e}")
             print(f"ERROR: Could not open PDF file: {filepath}\n{e}")
             return False
 
-    def display_page(self):
-        """Displays the current page of the document."""
+    @staticmethod
+    def lookup_cached(cache, cache_key):
+        """Returns the pixmap for cache_key, marking it recently used, or None if evicted or never rendered."""
+        entry = cache.get(cache_key)
+        if entry is None:
+            return None
+        pixmap = QPixmapCache.find(entry[0])
+        if pixmap is None:
+            del cache[cache_key]
+        else:
+            cache.move_to_end(cache_key)
+        return pixmap
+    
+    @staticmethod
+    def store_cached(cache, cache_key, pixmap):
+        """
+        Puts a pixmap in the shared QPixmapCache under cache_key.
+        
+        QPixmapCache evicts least recently used pixmaps across all tabs once
+        its byte budget is reached. Lookups keep this index in the same order,
+        so whatever no longer fits the budget is at the front and dropped here.
+        """
+        nbytes = pixmap.width() * pixmap.height() * pixmap.depth() // 8
+        cache[cache_key] = (QPixmapCache.insert(pixmap), nbytes)
+        cache.move_to_end(cache_key)
+        
+        budget = QPixmapCache.cacheLimit() * 1024
+        total = sum(size for _, size in cache.values())
+        while total > budget and len(cache) > 1:
+            _, (key, size) = cache.popitem(last=False)
+            QPixmapCache.remove(key)
+            total -= size
+    
+    def find_cached_pixmap(self, page_key):
+        """
+        Returns the cached pixmap for (page_index, zoom), or None if evicted,
+        never rendered or rendered for a screen with another pixel ratio.
+        """
+        pixmap = self.lookup_cached(self.pixmap_cache, page_key)
+        if pixmap is not None and pixmap.devicePixelRatio() != self.devicePixelRatioF():
+            return None  # Re-rendering replaces it
+        return pixmap
+    
+    def clear_pixmap_cache(self):
+        """Drops this document's rendered pages and tiles from the shared QPixmapCache."""
+        for key, _ in self.pixmap_cache.values():
+            QPixmapCache.remove(key)
+        for key, _ in self.tile_cache.values():
+            QPixmapCache.remove(key)
+        self.pixmap_cache = OrderedDict()
+        self.tile_cache = OrderedDict()
+        self.image_label.shown_key = None
+    
+    def find_thumbnail(self, page_index):
+        """Returns the reorder dialog's cached thumbnail of a page, or None."""
+        return self.lookup_cached(self.thumb_cache, page_index)
+    
+    def store_thumbnail(self, page_index, pixmap):
+        """
+        Caches a page thumbnail in the shared QPixmapCache, so it survives
+        reopening the dialog. The index has one entry per page and can't
+        outgrow the document, so unlike store_cached() it is never pruned;
+        thumbnails Qt evicts are dropped from it on lookup.
+        """
+        old_entry = self.thumb_cache.pop(page_index, None)
+        if old_entry is not None:
+            QPixmapCache.remove(old_entry[0])
+        nbytes = pixmap.width() * pixmap.height() * pixmap.depth() // 8
+        self.thumb_cache[page_index] = (QPixmapCache.insert(pixmap), nbytes)
+    
+    def clear_thumbnail_cache(self):
+        """Drops this document's thumbnails from the shared QPixmapCache."""
+        for key, _ in self.thumb_cache.values():
+            QPixmapCache.remove(key)
+        self.thumb_cache = OrderedDict()
+    
+    def page_pixel_size(self, page):
+        """Size in (device-independent) pixels of a page rendered at the current zoom."""
+        rect = page.rect
+        return QSize(math.ceil(rect.width * self.zoom_factor), math.ceil(rect.height * self.zoom_factor))
+    
+    def is_tiled(self, size):
+        dpr = self.devicePixelRatioF()
+        return size.width() * size.height() * dpr * dpr > TILED_PAGE_MIN_PIXELS
+    
+    def page_display_list(self, page_index):
+        """
+        Returns the page's parsed content as a fitz.DisplayList.
+        
+        Rendering from a display list skips interpreting the page's content
+        streams again, which is most of the work for every tile of a tiled
+        page and for each zoom step. Only used on the GUI thread; dropped by
+        invalidate_renders() whenever the document changes.
+        """
+        display_list = self._display_lists.get(page_index)
+        if display_list is None:
+            display_list = self.doc.load_page(page_index).get_displaylist()
+            self._display_lists[page_index] = display_list
+            while len(self._display_lists) > DISPLAY_LIST_CACHE_SIZE:
+                self._display_lists.popitem(last=False)
+        else:
+            self._display_lists.move_to_end(page_index)
+        return display_list
+    
+    def render_tile(self, tx, ty):
+        """Returns tile (tx, ty) of the current page at the current zoom, rendering it on a miss."""
+        tile_key = (self.current_page, self.zoom_factor, tx, ty)
+        dpr = self.devicePixelRatioF()
+        pixmap = self.lookup_cached(self.tile_cache, tile_key)
+        if pixmap is not None and pixmap.devicePixelRatio() == dpr:
+            return pixmap
+        
+        try:
+            display_list = self.page_display_list(self.current_page)
+            zoom = self.zoom_factor
+            clip = fitz.Rect(tx * PAGE_TILE_SIZE / zoom, ty * PAGE_TILE_SIZE / zoom,
+                             (tx + 1) * PAGE_TILE_SIZE / zoom, (ty + 1) * PAGE_TILE_SIZE / zoom)
+            pixmap = pixmap_from_page_image(render_page_image(display_list, zoom, clip & display_list.rect, dpr))
+        except Exception as e:
+            print(f"ERROR: Render tile {tx},{ty} of page {self.current_page + 1}: {e}")
+            return None
+        self.store_cached(self.tile_cache, tile_key, pixmap)
+        return pixmap
+    
+    def display_page(self, allow_async=True):
+        """
+        Displays the current page of the document.
+        
+        Uncached pages of saved documents are rendered in the background; the
+        page appears when the render arrives. With allow_async=False (or for
+        documents with unsaved edits) the page is rendered right here.
+        """
         # Prevent recursive update loops
         if self._update_in_progress:
             return
+        
+        # A hidden view (e.g. a background tab) draws when it is next shown
+        if not self.isVisible():
+            self._display_pending = True
+            return
+        self._display_pending = False
             
         self._update_in_progress = True
         
+        # Anything scheduled is covered by this call
+        self._display_timer.stop()
+        self._zoom_settle_timer.stop()
+        
         try:
             # Handle empty document case
             if self.total_pages == 0:
@@ -220,61 +712,40 @@ class PDFViewWidget(QWidget):
                 self.image_label.setPixmap(QPixmap())
                 return
                 
+            # Same page already on screen (e.g. stepping between matches): only
+            # the highlights can have changed
+            shown_key = (self.current_page, self.zoom_factor, self.devicePixelRatioF(), self._render_generation)
+            if self.image_label.shown_key == shown_key:
+                self.update_highlights()
+                return
+            
+            # Very large renders are drawn tile by tile as they scroll into view
+            page_size = self.page_pixel_size(self.doc.load_page(self.current_page))
+            if self.is_tiled(page_size):
+                self.image_label.set_tiled_page(page_size, self.render_tile)
+                self.image_label.shown_key = shown_key
+                self.image_label.fit_to_contents()
+                self.update_highlights()
+                return
+            
             # Check for cached page
             page_key = (self.current_page, self.zoom_factor)
-            pixmap = self.pixmap_cache.get(page_key)
+            pixmap = self.find_cached_pixmap(page_key)
+            
+            # Hand the render to the worker process when it can open the file
+            if not pixmap and allow_async and self.request_page_render():
+                return
             
             # Render the page if not cached
             if not pixmap:
                 try:
-                    page = self.doc.load_page(self.current_page)
-                    matrix = fitz.Matrix(self.zoom_factor, self.zoom_factor)
-                    pix = page.get_pixmap(matrix=matrix, alpha=False)
-                    qimage = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888)
-                    pixmap = QPixmap.fromImage(qimage)
-                    
-                    # Draw search highlights if needed
-                    if self.current_page in self.search_results.results:
-                        self.highlight_rects = self.search_results.results[self.current_page]
-                        
-                        # Create a painter to draw on the pixmap
-                        painter = QPainter(pixmap)
-                        
-                        # Draw all search highlights
-                        for i, rect in enumerate(self.highlight_rects):
-                            # Scaled rectangle based on zoom
-                            qrect = QRect(
-                                int(rect.x0 * self.zoom_factor),
-                                int(rect.y0 * self.zoom_factor),
-                                int((rect.x1 - rect.x0) * self.zoom_factor),
-                                int((rect.y1 - rect.y0) * self.zoom_factor)
-                            )
-                            
-                            # Check if this is the current highlight
-                            is_current = (self.current_page == self.search_results.current_page and 
-                                         i == self.search_results.current_match)
-                            
-                            # Use different colors for current vs other matches
-                            if is_current:
-                                highlight_color = QColor(255, 165, 0, 100)  # Orange highlight for current match
-                                border_color = QColor(255, 69, 0)  # Red-orange border
-                                painter.setPen(QPen(border_color, 2))
-                            else:
-                                highlight_color = QColor(255, 255, 0, 100)  # Yellow for other matches
-                                painter.setPen(Qt.PenStyle.NoPen)
-                            
-                            painter.setBrush(highlight_color)
-                            painter.drawRect(qrect)
-                        
-                        painter.end()
+                    display_list = self.page_display_list(self.current_page)
+                    pixmap = pixmap_from_page_image(render_page_image(display_list, self.zoom_factor,
+                                                                      dpr=self.devicePixelRatioF()))
                     
-                    # Cache the page
-                    self.pixmap_cache[page_key] = pixmap
-                    
-                    # Limit cache size
-                    if len(self.pixmap_cache) > 10:
-                        self.pixmap_cache.pop(next(iter(self.pixmap_cache)))
+                    self.store_cached(self.pixmap_cache, page_key, pixmap)
                 except Exception as e:
+                    shown_key = None  # Retry on the next call
                     print(f"ERROR: Render page {self.current_page + 1} for {self.current_filepath}: {e}")
                     error_pixmap = QPixmap(400, 300)
                     error_pixmap.fill(Qt.GlobalColor.white)
@@ -287,7 +758,12 @@ class PDFViewWidget(QWidget):
             
             # Display the page
             self.image_label.setPixmap(pixmap)
-            self.image_label.adjustSize()
+            self.image_label.shown_key = shown_key
+            self.image_label.fit_to_contents()
+            self.update_highlights()
+            
+            # Render the neighbors while the user looks at this page
+            QTimer.singleShot(0, self._prefetch_neighbors)
         finally:
             # Always release the update lock and trigger UI update
             self._update_in_progress = False
@@ -299,6 +775,165 @@ class PDFViewWidget(QWidget):
                 if main_window.get_current_view_widget() is self:
                     main_window.update_ui_for_current_tab()
 
+    def request_page_render(self):
+        """
+        Queues the current page on the render worker process, dropping queued
+        renders of pages the user has already moved past. Meanwhile a render
+        cached at another zoom is shown scaled, or failing that a quick
+        low-resolution render. Returns False if the worker isn't running yet
+        or has no way to read the document.
+        
+        Documents with unsaved changes (assemblies included) are rendered
+        here: the worker could only read them from a tobytes() snapshot, and
+        serializing the whole document on every edit costs far more than
+        rendering one page.
+        """
+        source = self.file_source()
+        if source is None:
+            return False
+        executor = get_render_executor()
+        if executor is None:
+            return False
+        
+        # Before queueing, so the worker doesn't hold up the preview
+        if not self.show_zoom_preview():
+            self.show_low_res_preview()
+        
+        self._render_request_id += 1
+        self.cancel_queued_renders()
+        return self.submit_render(executor, source, self.current_page, self._render_request_id)
+
+    def submit_render(self, executor, source, page_index, request_id):
+        """Submits a render of a page at the current zoom to the worker process."""
+        generation, zoom, dpr = self._render_generation, self.zoom_factor, self.devicePixelRatioF()
+        signals = self._render_signals
+        
+        def on_done(future):
+            # Runs on an executor thread, so only emits a signal
+            if future.cancelled():
+                return
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"WARNING: Background render of page {page_index + 1} failed: {e}")
+                result = None
+            signals.page_rendered.emit(generation, request_id, page_index, zoom, dpr, result)
+        
+        try:
+            future = executor.submit(_render_page_samples, source, page_index, zoom, dpr)
+        except RuntimeError as e:  # The worker died; a new one is started on next use
+            print(f"WARNING: Background render of page {page_index + 1} failed: {e}")
+            shutdown_render_executor()
+            return False
+        future.add_done_callback(on_done)
+        self._render_futures.append(future)
+        return True
+
+    def cancel_queued_renders(self):
+        """Drops renders the worker hasn't started; one already running still reports back."""
+        for future in self._render_futures:
+            future.cancel()
+        self._render_futures = []
+        self._prefetch_pending = set()
+
+    def show_low_res_preview(self):
+        """
+        Shows the current page rendered at 1/LOW_RES_PREVIEW_DIVISOR of the
+        zoom and stretched to full size; it has a fraction of the pixels to
+        rasterize and is replaced once the full render arrives.
+        
+        Only done when the page's display list is already cached: parsing
+        the page is most of the work of rendering it, and the worker parses
+        it again anyway.
+        """
+        display_list = self._display_lists.get(self.current_page)
+        if display_list is None:
+            return False
+        try:
+            page = self.doc.load_page(self.current_page)
+            size = self.page_pixel_size(page)
+            if self.is_tiled(size):
+                return False
+            dpr = self.devicePixelRatioF()
+            qimage = render_page_image(display_list, self.zoom_factor / LOW_RES_PREVIEW_DIVISOR, dpr=dpr)
+        except Exception as e:
+            print(f"WARNING: Preview of page {self.current_page + 1} failed: {e}")
+            return False
+        preview = pixmap_from_page_image(qimage).scaled(
+            round(size.width() * dpr), round(size.height() * dpr),
+            Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.FastTransformation)
+        preview.setDevicePixelRatio(dpr)
+        self.image_label.setPixmap(preview)
+        self.image_label.fit_to_contents()
+        self.update_highlights()
+        return True
+
+    def _prefetch_neighbors(self):
+        """
+        Renders the pages before and after the current one into the cache in
+        the background. Only done while the worker can read the file itself;
+        see request_page_render() for documents with unsaved changes.
+        """
+        if not self.doc or self.image_label.tiled_size is not None:
+            return  # Neighbors of a tiled page are too large to render whole
+        
+        source = self.file_source()
+        executor = get_render_executor()
+        if source is None or executor is None:
+            return
+        
+        # Futures of finished renders are no longer needed to cancel them
+        self._render_futures = [future for future in self._render_futures if not future.done()]
+        for page_index in (self.current_page + 1, self.current_page - 1):
+            page_key = (page_index, self.zoom_factor)
+            if not (0 <= page_index < self.total_pages) or page_key in self._prefetch_pending:
+                continue
+            if self.find_cached_pixmap(page_key) is not None:
+                continue
+            if self.submit_render(executor, source, page_index, 0):
+                self._prefetch_pending.add(page_key)
+
+    def _on_page_rendered(self, generation, request_id, page_index, zoom, dpr, result):
+        """Slot receiving a background render; caches it under the zoom it was rendered at."""
+        if generation != self._render_generation:
+            return
+        page_key = (page_index, zoom)
+        self._prefetch_pending.discard(page_key)
+        if result is not None and self.find_cached_pixmap(page_key) is None:
+            pixmap = pixmap_from_page_image(page_image_from_samples(*result, dpr))
+            self.store_cached(self.pixmap_cache, page_key, pixmap)
+        
+        # Show it if the view is still waiting for exactly this page
+        if request_id and request_id == self._render_request_id:
+            self._render_request_id = 0
+            if page_key == (self.current_page, self.zoom_factor):
+                # A failed render is retried here so the error is shown
+                self.display_page(allow_async=False)
+
+    def invalidate_renders(self):
+        """Drops background renders in flight and parsed pages; their page indices may no longer apply."""
+        self._display_lists = OrderedDict()
+        self._render_generation += 1
+        self._render_request_id = 0
+        self.cancel_queued_renders()
+
+    def stop_background_renders(self):
+        """Drops this view's background renders and has the worker close its file."""
+        self.invalidate_renders()
+        filepath = self.current_filepath
+        if _render_executor is not None and filepath and not filepath.startswith(ASSEMBLY_PREFIX):
+            try:
+                _render_executor.submit(_release_worker_document, filepath)
+            except RuntimeError:
+                pass  # The worker is gone, and its documents with it
+
+    def update_highlights(self):
+        """Points the highlight overlay at the current page's search matches."""
+        results = self.search_results
+        self.highlight_rects = results.results.get(self.current_page, [])
+        current_index = results.current_match if results.current_page == self.current_page else -1
+        self.highlight_overlay.set_highlights(self.highlight_rects, current_index, self.zoom_factor)
+
     def get_current_page_info(self):
         """Returns current page index and total pages."""
         if self.doc:
@@ -310,28 +945,32 @@ class PDFViewWidget(QWidget):
             return self.current_page, self.total_pages
         return 0, 0
 
+    def schedule_display_page(self):
+        """Redraws on the next frame, so repeated calls in between draw only once."""
+        self._display_timer.start()
+
     def goto_page(self, page_index):
-        """Sets the current page and redraws."""
+        """Sets the current page and schedules a redraw."""
         if self.doc and 0 <= page_index < self.total_pages:
             if self.current_page != page_index:
                 self.current_page = page_index
-                self.display_page()
+                self.schedule_display_page()
                 return True
         return False
 
     def next_page(self):
-        """Moves to the next page if possible and redraws."""
+        """Moves to the next page if possible and schedules a redraw."""
         if self.doc and self.current_page < self.total_pages - 1:
             self.current_page += 1
-            self.display_page()
+            self.schedule_display_page()
             return True
         return False
 
     def prev_page(self):
-        """Moves to the previous page if possible and redraws."""
+        """Moves to the previous page if possible and schedules a redraw."""
         if self.doc and self.current_page > 0:
             self.current_page -= 1
-            self.display_page()
+            self.schedule_display_page()
             return True
         return False
 
@@ -343,21 +982,75 @@ class PDFViewWidget(QWidget):
             
             # Only update if zoom changed significantly
             if abs(self.zoom_factor - factor) > 0.01:
-                self.zoom_factor = factor
-                self.pixmap_cache = {}  # Invalidate cache on zoom change
-                self.display_page()
+                self.zoom_factor = factor  # cache is keyed by zoom; other levels stay cached
+                if self.show_zoom_preview():
+                    # Rasterize at the new zoom once the user stops zooming
+                    self._zoom_settle_timer.start()
+                else:
+                    self.schedule_display_page()
                 return True
         return False
 
+    def show_zoom_preview(self):
+        """
+        Shows the current page scaled from a render cached at another zoom.
+        
+        Scaling a bitmap is far cheaper than having MuPDF rasterize the page
+        again, so stepping through zoom levels stays responsive. Returns False
+        if the page is already cached at this zoom or has no render to scale.
+        """
+        if not self.doc or self.find_cached_pixmap((self.current_page, self.zoom_factor)) is not None:
+            return False
+        if self.is_tiled(self.page_pixel_size(self.doc.load_page(self.current_page))):
+            return False  # Tiles render only what is visible; don't scale up a whole page
+        
+        # Prefer the smallest render at least as large as needed (downscaling
+        # stays sharp), otherwise the largest one available
+        best_zoom, best_pixmap = None, None
+        for page_index, zoom in list(self.pixmap_cache):
+            if page_index != self.current_page:
+                continue
+            pixmap = self.find_cached_pixmap((page_index, zoom))
+            if pixmap is None:
+                continue
+            if (best_zoom is None
+                    or (zoom >= self.zoom_factor and (best_zoom < self.zoom_factor or zoom < best_zoom))
+                    or (zoom < self.zoom_factor and best_zoom < zoom)):
+                best_zoom, best_pixmap = zoom, pixmap
+        if best_pixmap is None:
+            return False
+        
+        scale = self.zoom_factor / best_zoom
+        preview = best_pixmap.scaled(round(best_pixmap.width() * scale), round(best_pixmap.height() * scale),
+                                     Qt.AspectRatioMode.IgnoreAspectRatio,
+                                     Qt.TransformationMode.SmoothTransformation)
+        preview.setDevicePixelRatio(best_pixmap.devicePixelRatio())
+        self.image_label.setPixmap(preview)
+        self.image_label.fit_to_contents()
+        self.update_highlights()
+        return True
+
     def search_text(self, query, case_sensitive=False, whole_words=False):
-        """Search for text in the document."""
+        """
+        Starts searching the document for text.
+        
+        Pages are searched in order on the GUI thread, SEARCH_SLICE_MS at a
+        time with events handled in between; MuPDF holds the GIL while it
+        extracts text, so a worker thread would not stall the GUI any less.
+        Matches are added as pages finish and search_updated is emitted for
+        each page with matches and once more when the search completes; the
+        view jumps to the first match as soon as it is found. A search
+        repeated before the document changes is answered from the results of
+        the last one. Returns True if a search was started or answered.
+        """
         if not self.doc or not query:
             return False
         
         # Reset search results
+        self.cancel_search()
         self.search_results.reset()
         self.search_results.query = query
-        self.pixmap_cache = {}  # Clear cache to redraw with highlights
+        self.update_highlights()  # Remove highlights of the previous search
         
         # PyMuPDF search flags
         # In PyMuPDF/Fitz, these are the commonly used constants:
@@ -376,27 +1069,132 @@ class PDFViewWidget(QWidget):
         if whole_words:
             search_flags |= 2  # TEXT_SEARCH_WHOLE_WORDS value
         
-        try:
-            # Search all pages
-            for page_idx in range(self.total_pages):
-                page = self.doc.load_page(page_idx)
-                matches = page.search_for(query, flags=search_flags)
-                if matches:
-                    self.search_results.add_matches(page_idx, matches)
-            
-            # If we found results, navigate to the first match
+        # MuPDF search ignores case, and every whitespace-separated term of the
+        # query must appear verbatim in the page text for the page to match
+        terms = query.lower().split()
+        
+        if self.total_pages == 0:
+            return False
+        
+        self._search_key = (query, search_flags)
+        cached = self._search_cache.get(self._search_key)
+        if cached is not None:
+            for page_index in sorted(cached):
+                self.search_results.add_matches(page_index, cached[page_index])
             if self.search_results.has_results():
-                page_idx, rect = self.search_results.navigate_to_match(forward=True)
-                if page_idx >= 0:
-                    self.goto_page(page_idx)
-                return True
-            else:
-                # Redraw current page without highlights
-                self.display_page()
-                return False
+                page_idx, _ = self.search_results.navigate_to_match(forward=True)
+                if page_idx >= 0 and not self.goto_page(page_idx):
+                    self.update_highlights()
+            self.search_updated.emit()
+            return True
+        
+        self._search_terms = terms
+        self._search_next_page = 0
+        self._search_timer.start()
+        return True
+
+    def _search_step(self):
+        """Searches the next pages, in order, until SEARCH_SLICE_MS is used up or the document ends."""
+        query, flags = self._search_key
+        deadline = time.perf_counter() + SEARCH_SLICE_MS / 1000
+        found = False
+        try:
+            while self._search_next_page < self.total_pages:
+                page_index = self._search_next_page
+                self._search_next_page += 1
+                
+                # Cheap test against the page text before asking MuPDF for hit rects
+                text = self._cached_page_text(page_index, flags)
+                if all(term in text for term in self._search_terms):
+                    # Converted once here, so the overlay can draw them as they are
+                    matches = [QRectF(rect.x0, rect.y0, rect.width, rect.height)
+                               for rect in self.doc.load_page(page_index).search_for(query, flags=flags)]
+                    if matches:
+                        found = True
+                        self.search_results.add_matches(page_index, matches)
+                        if self.search_results.current_match < 0:
+                            # Pages go in order, so this is the first match in the document
+                            self._show_first_match()
+                        elif page_index == self.current_page:
+                            self.update_highlights()
+                if time.perf_counter() >= deadline:
+                    break
         except Exception as e:
             print(f"ERROR: Search failed: {e}")
-            return False
+            self._search_next_page = self.total_pages
+        
+        if self._search_next_page >= self.total_pages:
+            self._search_timer.stop()
+            # Remember the complete results; the oldest search is forgotten first
+            self._search_cache.pop(self._search_key, None)
+            self._search_cache[self._search_key] = dict(self.search_results.results)
+            while len(self._search_cache) > SEARCH_CACHE_SIZE:
+                del self._search_cache[next(iter(self._search_cache))]
+            self.search_updated.emit()
+        elif found:
+            self.search_updated.emit()
+
+    def _show_first_match(self):
+        """Goes to the first search match in document order."""
+        page_idx, _ = self.search_results.navigate_to_match(forward=True)
+        if page_idx >= 0 and not self.goto_page(page_idx):
+            self.update_highlights()
+
+    def is_search_running(self):
+        return self._search_timer.isActive()
+
+    def cancel_search(self):
+        """Stops a running search; the matches found so far are kept in search_results."""
+        self._search_timer.stop()
+
+    def file_source(self):
+        """The file path while it matches the in-memory document, otherwise None."""
+        filepath = self.current_filepath
+        if (not self.is_modified and filepath and not filepath.startswith(ASSEMBLY_PREFIX)
+                and os.path.exists(filepath)):
+            return filepath
+        return None
+
+    def get_document_source(self):
+        """
+        What worker processes should open to read this document:
+        the file itself while it matches the document, otherwise a snapshot of
+        the in-memory document (kept until the next modification).
+        """
+        filepath = self.file_source()
+        if filepath is not None:
+            return filepath
+        if self._doc_snapshot is None:
+            self._doc_snapshot = self.doc.tobytes()
+        return self._doc_snapshot
+
+    def _cached_page_text(self, page_index, flags):
+        """Returns the lowercased text of a page as extracted with flags, extracting it only on first use."""
+        text = self._page_text_cache.get((page_index, flags))
+        if text is None:
+            text = self.doc.load_page(page_index).get_text("text", flags=flags).lower()
+            self._page_text_cache[(page_index, flags)] = text
+        return text
+
+    def has_searchable_text(self, sample_pages=5):
+        """
+        Whether the first pages hold real text rather than only images
+        (scans). Reads the page text the search already extracted and
+        stops at the first page with text.
+        """
+        for page_index in range(min(sample_pages, self.total_pages)):
+            # Text extracted with any of the search flag combinations will do;
+            # they only differ in how ligatures and whitespace come out
+            text = next((self._page_text_cache[(page_index, flags)] for flags in range(4)
+                         if (page_index, flags) in self._page_text_cache), None)
+            if text is None:
+                try:
+                    text = self._cached_page_text(page_index, 1)  # Flags of a default (ignore case) search
+                except Exception:
+                    continue
+            if len(text.strip()) > 20:  # More than 20 chars is likely real text
+                return True
+        return False
 
     def find_next(self, forward=True):
         """Find the next or previous search result."""
@@ -410,15 +1208,19 @@ class PDFViewWidget(QWidget):
                 if page_idx != self.current_page:
                     self.goto_page(page_idx)
                 else:
-                    # Just redraw the current page to update highlights
-                    self.pixmap_cache = {}  # Clear cache to redraw with highlights
-                    self.display_page()
+                    # Same page; only the highlights need repainting
+                    self.update_highlights()
                 return True
             return False
         except Exception as e:
             print(f"ERROR: Navigation failed: {e}")
             return False
 
+    @property
+    def total_pages(self):
+        """Page count of the open document, read from the document so it never goes stale."""
+        return len(self.doc) if self.doc is not None else 0
+
     # Simple getter methods
     def get_document(self):
         return self.doc
@@ -435,8 +1237,46 @@ class PDFViewWidget(QWidget):
     def get_search_results(self):
         return self.search_results
 
-    def mark_modified(self, modified=True):
+    def remap_page_caches(self, new_order):
+        """
+        Carries the per-page caches over a reordering of the document.
+        
+        new_order[i] is the old index of the page now at index i; the pages
+        themselves are unchanged, so their pixmaps and text stay valid. Pages
+        left out of new_order were deleted and their renders are dropped.
+        """
+        new_index = {old: new for new, old in enumerate(new_order)}
+        cached = list(self.pixmap_cache.items()) + list(self.tile_cache.items())
+        cached += [((page,), entry) for page, entry in self.thumb_cache.items()]
+        for (page, *_), (key, _) in cached:
+            if page not in new_index:
+                QPixmapCache.remove(key)
+        self.pixmap_cache = OrderedDict(((new_index[page], zoom), entry)
+                                        for (page, zoom), entry in self.pixmap_cache.items() if page in new_index)
+        self.tile_cache = OrderedDict(((new_index[page], zoom, tx, ty), entry)
+                                      for (page, zoom, tx, ty), entry in self.tile_cache.items() if page in new_index)
+        self.thumb_cache = OrderedDict((new_index[page], entry)
+                                       for page, entry in self.thumb_cache.items() if page in new_index)
+        self._page_text_cache = {(new_index[page], flags): text
+                                 for (page, flags), text in self._page_text_cache.items() if page in new_index}
+        self._search_cache = {search_key: {new_index[page]: rects for page, rects in results.items() if page in new_index}
+                              for search_key, results in self._search_cache.items()}
+    
+    def mark_modified(self, modified=True, keep_page_caches=False):
         """Sets the modified state and updates the parent tab's text."""
+        # A search or prefetch in progress would report results for the old pages
+        self._doc_snapshot = None
+        if modified:
+            self.cancel_search()
+            self.invalidate_renders()
+        
+        # Any edit can change page content or order, so per-page caches are stale
+        # unless the caller has already brought them up to date
+        if modified and not keep_page_caches:
+            self.clear_thumbnail_cache()
+            self._page_text_cache = {}
+            self._search_cache = {}
+            
         if self.is_modified == modified:
             return  # No change needed
 
@@ -469,8 +1309,8 @@ class PDFViewWidget(QWidget):
         if main_window is not None and hasattr(main_window, 'update_button_states') and callable(main_window.update_button_states):
             main_window.update_button_states()
 
-    def save_as(self, suggested_dir=""):
-        """Saves the current document to a new file."""
+    def save_as(self, suggested_dir="", optimize=False):
+        """Saves the current document to a new file, optionally optimizing it (see save_pdf)."""
         if not self.doc:
             show_message(self, "Nothing to Save", "No document loaded.", QMessageBox.Icon.Warning)
             return False
@@ -492,14 +1332,14 @@ class PDFViewWidget(QWidget):
         default_path = os.path.join(suggested_dir, suggested_name)
         
         # Get save path from user
+        title = "Optimize and Save PDF As..." if optimize else "Save PDF As..."
         save_path, _ = QFileDialog.getSaveFileName(
-            self, "Save PDF As...", default_path, "PDF Files (*.pdf);;All Files (*)"
+            self, title, default_path, "PDF Files (*.pdf);;All Files (*)"
         )
 
         if save_path:
             try:
-                # Save with optimization options
-                self.doc.save(save_path, garbage=4, deflate=True)
+                save_pdf(self.doc, save_path, optimize)
                 
                 # Update document state
                 self.current_filepath = save_path
@@ -555,11 +1395,10 @@ class PDFViewWidget(QWidget):
                 
                 # Perform deletion
                 self.doc.delete_page(page_num_to_delete)
-                self.total_pages -= 1
                 
-                # Mark as modified and clear cache
-                self.mark_modified(True)
-                self.pixmap_cache = {}
+                # The remaining pages are unchanged; keep their renders under their new indices
+                self.remap_page_caches([i for i in range(self.total_pages + 1) if i != page_num_to_delete])
+                self.mark_modified(True, keep_page_caches=True)
                 
                 # Adjust current page index
                 if self.current_page >= self.total_pages and self.total_pages > 0:
@@ -583,106 +1422,13 @@ class PDFViewWidget(QWidget):
         """Moves the current page up one position (earlier in the document)."""
         if not self.doc or self.current_page <= 0:
             return False
-            
-        try:
-            # Store the page index we're moving
-            page_to_move = self.current_page
-            target_position = page_to_move - 1
-            
-            # We need to use a temporary document to reorder pages
-            # because sometimes direct move_page doesn't work reliably
-            temp_doc = fitz.open()
-            
-            # First, copy all pages up to the target position
-            for i in range(target_position):
-                if i != page_to_move:  # Skip the page we're moving
-                    temp_doc.insert_pdf(self.doc, from_page=i, to_page=i)
-                    
-            # Now insert the page we're moving
-            temp_doc.insert_pdf(self.doc, from_page=page_to_move, to_page=page_to_move)
-            
-            # Then copy all remaining pages
-            for i in range(target_position, self.total_pages):
-                if i != page_to_move:  # Skip the page we already moved
-                    temp_doc.insert_pdf(self.doc, from_page=i, to_page=i)
-            
-            # Close the current document and replace with our reordered one
-            self.doc.close()
-            self.doc = temp_doc
-            
-            # Update total pages count
-            self.total_pages = len(self.doc)
-            
-            # Mark as modified
-            self.mark_modified(True)
-            
-            # Clear cache to ensure updated rendering
-            self.pixmap_cache = {}
-            
-            # Adjust current page index to follow the moved page
-            self.current_page = target_position
-            
-            # Refresh display
-            self.display_page()
-            print(f"Successfully moved page {page_to_move+1} to position {target_position+1}")
-            return True
-        except Exception as e:
-            print(f"ERROR: Failed to move page up: {e}")
-            show_message(self, "Error", f"Failed to move page: {e}", QMessageBox.Icon.Critical)
-            return False
+        return self.move_page_to(self.current_page, self.current_page - 1)
 
     def move_current_page_down(self):
         """Moves the current page down one position (later in the document)."""
         if not self.doc or self.current_page >= self.total_pages - 1:
             return False
-            
-        try:
-            # Store the page index we're moving
-            page_to_move = self.current_page
-            target_position = page_to_move + 1
-            
-            # We need to use a temporary document to reorder pages
-            # because sometimes direct move_page doesn't work reliably
-            temp_doc = fitz.open()
-            
-            # First, copy all pages up to the page we're moving
-            for i in range(page_to_move):
-                temp_doc.insert_pdf(self.doc, from_page=i, to_page=i)
-                
-            # Next, copy the page that was after our target (which will now come before)
-            temp_doc.insert_pdf(self.doc, from_page=target_position, to_page=target_position)
-            
-            # Now insert the page we're moving
-            temp_doc.insert_pdf(self.doc, from_page=page_to_move, to_page=page_to_move)
-            
-            # Then copy all remaining pages
-            for i in range(target_position+1, self.total_pages):
-                temp_doc.insert_pdf(self.doc, from_page=i, to_page=i)
-            
-            # Close the current document and replace with our reordered one
-            self.doc.close()
-            self.doc = temp_doc
-            
-            # Update total pages count
-            self.total_pages = len(self.doc)
-            
-            # Mark as modified
-            self.mark_modified(True)
-            
-            # Clear cache to ensure updated rendering
-            self.pixmap_cache = {}
-            
-            # Adjust current page index to follow the moved page
-            self.current_page = target_position
-            
-            # Refresh display
-            self.display_page()
-            print(f"Successfully moved page {page_to_move+1} to position {target_position+1}")
-            return True
-        except Exception as e:
-            print(f"ERROR: Failed to move page down: {e}")
-            show_message(self, "Error", f"Failed to move page: {e}", QMessageBox.Icon.Critical)
-            return False
+        return self.move_page_to(self.current_page, self.current_page + 1)
 
     def move_page_to(self, from_index, to_index):
         """Moves a page from one position to another in the document."""
@@ -694,55 +1440,17 @@ class PDFViewWidget(QWidget):
             return True
             
         try:
-            # Create a new document with pages in the desired order
-            temp_doc = fitz.open()
+            # Permute the page tree in place with the moved page rotated into
+            # position; no page content is copied
+            new_order = list(range(self.total_pages))
+            new_order.insert(to_index, new_order.pop(from_index))
+            self.doc.select(new_order)
             
-            # Moving earlier page to later position
-            if from_index < to_index:
-                # Copy pages before the source page
-                for i in range(from_index):
-                    temp_doc.insert_pdf(self.doc, from_page=i, to_page=i)
-                    
-                # Copy pages between source and destination (they shift up by one)
-                for i in range(from_index + 1, to_index + 1):
-                    temp_doc.insert_pdf(self.doc, from_page=i, to_page=i)
-                    
-                # Insert the source page at the destination
-                temp_doc.insert_pdf(self.doc, from_page=from_index, to_page=from_index)
-                
-                # Copy any remaining pages
-                for i in range(to_index + 1, self.total_pages):
-                    temp_doc.insert_pdf(self.doc, from_page=i, to_page=i)
-            
-            # Moving later page to earlier position
-            else:  # from_index > to_index
-                # Copy pages before the destination
-                for i in range(to_index):
-                    temp_doc.insert_pdf(self.doc, from_page=i, to_page=i)
-                    
-                # Insert the source page at the destination
-                temp_doc.insert_pdf(self.doc, from_page=from_index, to_page=from_index)
-                
-                # Copy pages between destination and source (they shift down by one)
-                for i in range(to_index, from_index):
-                    temp_doc.insert_pdf(self.doc, from_page=i, to_page=i)
-                    
-                # Copy any remaining pages
-                for i in range(from_index + 1, self.total_pages):
-                    temp_doc.insert_pdf(self.doc, from_page=i, to_page=i)
-            
-            # Replace the current document with our reordered one
-            self.doc.close()
-            self.doc = temp_doc
-            
-            # Update total pages count
-            self.total_pages = len(self.doc)
+            # Pages only changed position, so move their cached renders along
+            self.remap_page_caches(new_order)
             
             # Mark as modified
-            self.mark_modified(True)
-            
-            # Clear cache to ensure updated rendering
-            self.pixmap_cache = {}
+            self.mark_modified(True, keep_page_caches=True)
             
             # Update current page index to follow the moved page
             if self.current_page == from_index:
@@ -804,8 +1512,9 @@ class PDFViewWidget(QWidget):
         if not self.doc:
             return
             
-        # Create menu
-        context_menu = QMenu(self)
+        # Refill the menu (the actions belong to this widget, so clear() keeps them)
+        context_menu = self.context_menu
+        context_menu.clear()
         
         # Existing assembly operations (only show if not in assembly document)
         if not self._is_assembly_target:
@@ -813,15 +1522,13 @@ class PDFViewWidget(QWidget):
             if assembly_widget:
                 # Only add "Add Current Page" if there's a valid current page
                 if 0 <= self.current_page < self.total_pages:
-                    add_current_action = QAction(f"Add Page {self.current_page + 1} to Assembly", self)
-                    add_current_action.triggered.connect(self.add_current_page_to_assembly)
-                    context_menu.addAction(add_current_action)
+                    self.add_current_action.setText(f"Add Page {self.current_page + 1} to Assembly")
+                    context_menu.addAction(self.add_current_action)
                 
                 # Add "Add All Pages" if document has pages
                 if self.total_pages > 0:
-                    add_all_action = QAction(f"Add All {self.total_pages} Pages to Assembly", self)
-                    add_all_action.triggered.connect(self.add_all_pages_to_assembly)
-                    context_menu.addAction(add_all_action)
+                    self.add_all_action.setText(f"Add All {self.total_pages} Pages to Assembly")
+                    context_menu.addAction(self.add_all_action)
         
         # Add page reordering actions (available in any document with multiple pages)
         if self.total_pages > 1:
@@ -830,21 +1537,15 @@ class PDFViewWidget(QWidget):
                 context_menu.addSeparator()
                 
             # Move page up action (disabled for first page)
-            move_up_action = QAction("Move Page Up", self)
-            move_up_action.triggered.connect(self.move_current_page_up)
-            move_up_action.setEnabled(self.current_page > 0)
-            context_menu.addAction(move_up_action)
+            self.move_up_action.setEnabled(self.current_page > 0)
+            context_menu.addAction(self.move_up_action)
             
             # Move page down action (disabled for last page)
-            move_down_action = QAction("Move Page Down", self)
-            move_down_action.triggered.connect(self.move_current_page_down)
-            move_down_action.setEnabled(self.current_page < self.total_pages - 1)
-            context_menu.addAction(move_down_action)
+            self.move_down_action.setEnabled(self.current_page < self.total_pages - 1)
+            context_menu.addAction(self.move_down_action)
             
             # Move to specific page
-            move_to_action = QAction("Move Page To...", self)
-            move_to_action.triggered.connect(self.show_move_page_dialog)
-            context_menu.addAction(move_to_action)
+            context_menu.addAction(self.move_to_action)
         
         # Only show menu if it has actions
         if not context_menu.isEmpty():
@@ -853,10 +1554,13 @@ class PDFViewWidget(QWidget):
 
     def find_parent_tab_widget(self):
         """Helper to find the QTabWidget containing this widget."""
+        if self._tab_widget is not None:
+            return self._tab_widget
         from PyQt6.QtWidgets import QTabWidget
         parent = self.parent()
         while parent is not None:
             if isinstance(parent, QTabWidget):
+                self._tab_widget = parent  # A view stays in its tab widget until it is closed
                 return parent
             parent = parent.parent()
         return None
@@ -864,92 +1568,74 @@ class PDFViewWidget(QWidget):
     def find_assembly_widget(self):
         """Finds the currently active assembly widget instance."""
         tab_widget = self.find_parent_tab_widget()
-        if tab_widget:
-            for i in range(tab_widget.count()):
-                widget = tab_widget.widget(i)
-                if isinstance(widget, PDFViewWidget) and widget.is_assembly_target():
-                    return widget
+        if not tab_widget:
+            return None
+        
+        # Reuse the last one found while it is still an open assembly tab
+        widget = self._assembly_widget_ref() if self._assembly_widget_ref else None
+        if widget is not None and widget.is_assembly_target() and tab_widget.indexOf(widget) != -1:
+            return widget
+        
+        self._assembly_widget_ref = None
+        for i in range(tab_widget.count()):
+            widget = tab_widget.widget(i)
+            if isinstance(widget, PDFViewWidget) and widget.is_assembly_target():
+                self._assembly_widget_ref = weakref.ref(widget)
+                return widget
         return None
 
     def add_current_page_to_assembly(self):
         """Adds the currently viewed page to the assembly document."""
-        assembly_widget = self.find_assembly_widget()
-        if assembly_widget and self.doc and 0 <= self.current_page < self.total_pages:
-            target_doc = assembly_widget.get_document()
-            source_doc = self.doc
-            page_num = self.current_page
-            
-            try:
-                # Remember initial state
-                was_empty = assembly_widget.total_pages == 0
-                
-                # Insert the current page into the assembly document
-                target_doc.insert_pdf(source_doc, from_page=page_num, to_page=page_num)
-                
-                # Update assembly document state
-                assembly_widget.total_pages = len(target_doc)
-                
-                # Navigate to the newly added page in the assembly tab
-                new_page_index = assembly_widget.total_pages - 1
-                assembly_widget.goto_page(new_page_index)
-                
-                # Force refresh if this was the first page
-                if was_empty:
-                    assembly_widget.pixmap_cache = {}  # Clear cache
-                    assembly_widget.display_page()  # Force refresh
-                
-                # Mark assembly as modified
-                assembly_widget.mark_modified(True)
-                
-                # Switch to assembly tab
-                tab_widget = self.find_parent_tab_widget()
-                if tab_widget:
-                    tab_widget.setCurrentWidget(assembly_widget)
-                    
-                print(f"Added page {page_num + 1} from {os.path.basename(self.current_filepath)} to Assembly.")
-            except Exception as e:
-                print(f"Error adding page {page_num+1}: {e}")
-                show_message(self, "Error", f"Could not add page:\n{e}", QMessageBox.Icon.Warning)
+        if self.doc and 0 <= self.current_page < self.total_pages:
+            self.append_pages_to_assembly(self.current_page, self.current_page)
 
     def add_all_pages_to_assembly(self):
         """Adds all pages from the current document to the assembly document."""
+        if self.doc and self.total_pages > 0:
+            self.append_pages_to_assembly(0, self.total_pages - 1)
+
+    def append_pages_to_assembly(self, from_page, to_page):
+        """Appends a range of pages (0-based, inclusive) to the assembly document and shows the first of them."""
         assembly_widget = self.find_assembly_widget()
-        if assembly_widget and self.doc and self.total_pages > 0:
+        if not assembly_widget:
+            return False
+        
+        if from_page == to_page:
+            description = f"page {from_page + 1}"
+        elif from_page == 0 and to_page == self.total_pages - 1:
+            description = f"all {self.total_pages} pages"
+        else:
+            description = f"pages {from_page + 1}-{to_page + 1}"
+        
+        try:
             target_doc = assembly_widget.get_document()
-            source_doc = self.doc
             
-            try:
-                # Remember initial state and page count before insertion
-                was_empty = assembly_widget.total_pages == 0
-                num_pages_before = assembly_widget.total_pages
-                
-                # Insert all pages
-                target_doc.insert_pdf(source_doc)
-                
-                # Update assembly document state
-                assembly_widget.total_pages = len(target_doc)
-                
-                # Navigate to the first of the newly added pages
-                new_page_index = num_pages_before
-                assembly_widget.goto_page(new_page_index)
-                
-                # Force refresh if this was the first page added to an empty assembly
-                if was_empty:
-                    assembly_widget.pixmap_cache = {}  # Clear cache
-                    assembly_widget.display_page()  # Force refresh
-                
-                # Mark assembly as modified
-                assembly_widget.mark_modified(True)
+            # Remember where the new pages will start
+            new_page_index = len(target_doc)
+            
+            # Insert the pages
+            target_doc.insert_pdf(self.doc, from_page=from_page, to_page=to_page)
+            if to_page > from_page:
+                shrink_mupdf_store()  # A bulk copy leaves the whole source parsed in MuPDF's store
+            
+            # Mark assembly as modified (this drops its renders in flight, so do it before navigating)
+            assembly_widget.mark_modified(True)
+            
+            # Navigate to the first of the newly added pages
+            if not assembly_widget.goto_page(new_page_index):
+                assembly_widget.display_page()  # Already on that index (the assembly was empty)
+            
+            # Switch to assembly tab
+            tab_widget = self.find_parent_tab_widget()
+            if tab_widget:
+                tab_widget.setCurrentWidget(assembly_widget)
                 
-                # Switch to assembly tab
-                tab_widget = self.find_parent_tab_widget()
-                if tab_widget:
-                    tab_widget.setCurrentWidget(assembly_widget)
-                    
-                print(f"Added all {len(source_doc)} pages from {os.path.basename(self.current_filepath)} to Assembly.")
-            except Exception as e:
-                print(f"Error adding all pages: {e}")
-                show_message(self, "Error", f"Could not add pages:\n{e}", QMessageBox.Icon.Warning)
+            print(f"Added {description} from {os.path.basename(self.current_filepath)} to Assembly.")
+            return True
+        except Exception as e:
+            print(f"Error adding {description}: {e}")
+            show_message(self, "Error", f"Could not add {description}:\n{e}", QMessageBox.Icon.Warning)
+            return False
 
     def close_document(self):
         """Closes the fitz document if open."""
@@ -961,10 +1647,15 @@ class PDFViewWidget(QWidget):
             except Exception as e:
                 print(f"Error closing document {filepath_msg}: {e}")
             finally:
+                self.stop_background_renders()
                 self.doc = None
                 self.current_filepath = None
-                self.total_pages = 0
                 self.current_page = 0
                 self.is_modified = False
-                self.pixmap_cache = {}
-                self.search_results.reset()
\ No newline at end of file
+                self.clear_pixmap_cache()
+                self.clear_thumbnail_cache()
+                self._page_text_cache = {}
+                self._doc_snapshot = None
+                self.cancel_search()
+                self.search_results.reset()
+                shrink_mupdf_store()  # Drop the closed document's fonts and images from the shared store
\ No newline at end of file
@@ -4,15 +4,28 @@ from PyQt6.QtWidgets import (
     QFrame, QHBoxLayout, QLineEdit, QPushButton, 
     QCheckBox, QLabel
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 
 from freebird.ui.pdf_view import PDFViewWidget
 
+# Delay after the last keystroke before searching as the user types
+SEARCH_DEBOUNCE_MS = 250
+
 class SearchPanel(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFrameShape(QFrame.Shape.StyledPanel)
         self.main_window = parent
+        
+        # Coalesces bursts of edits into a single full-document search
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._run_search)
+        
+        # View whose background search updates this panel's status
+        self._search_view = None
+        
         self.init_ui()
         
     def init_ui(self):
@@ -23,14 +36,17 @@ class SearchPanel(QFrame):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search text...")
         self.search_input.returnPressed.connect(self.on_search)
+        self.search_input.textEdited.connect(self.schedule_search)
         layout.addWidget(self.search_input, 1)  # Stretch factor 1
         
         # Case sensitive checkbox
         self.case_sensitive_check = QCheckBox("Match case")
+        self.case_sensitive_check.toggled.connect(self.schedule_search)
         layout.addWidget(self.case_sensitive_check)
         
         # Whole words checkbox
         self.whole_words_check = QCheckBox("Whole words")
+        self.whole_words_check.toggled.connect(self.schedule_search)
         layout.addWidget(self.whole_words_check)
         
         # Search buttons
@@ -60,8 +76,19 @@ class SearchPanel(QFrame):
         # Set initial state
         self.update_ui_state(False)
         
+    def schedule_search(self):
+        """Restart the debounce timer; the search runs once edits pause."""
+        self._search_timer.start()
+    
+    def _run_search(self):
+        """Debounce timer callback."""
+        if self.search_input.text().strip():
+            self.on_search()
+    
     def on_search(self):
         """Handle search button click."""
+        # An explicit search supersedes any pending debounced one
+        self._search_timer.stop()
         query = self.search_input.text().strip()
         if not query:
             return
@@ -70,21 +97,47 @@ class SearchPanel(QFrame):
         if view_widget and isinstance(view_widget, PDFViewWidget):
             case_sensitive = self.case_sensitive_check.isChecked()
             whole_words = self.whole_words_check.isChecked()
-            success = view_widget.search_text(query, case_sensitive, whole_words)
-            
-            self.update_ui_state(success)
-            
-            if success:
-                # Update the status with match info
-                search_results = view_widget.get_search_results()
-                self.status_label.setText(f"{search_results.get_current_match_info()}")
-            else:
-                query_msg = f"No matches found for '{query}'"
-                # Check if this might be an image-based PDF
-                has_text = self.check_document_has_text()
-                if not has_text:
-                    query_msg += " - This PDF may contain images or scanned text rather than searchable text"
-                self.status_label.setText(query_msg)
+            self.watch_search(view_widget)
+            view_widget.search_text(query, case_sensitive, whole_words)
+            self.on_search_updated()
+    
+    def watch_search(self, view_widget):
+        """Follow search progress of view_widget (searches run in the background)."""
+        if self._search_view is view_widget:
+            return
+        if self._search_view is not None:
+            try:
+                self._search_view.search_updated.disconnect(self.on_search_updated)
+            except (TypeError, RuntimeError):
+                pass  # Already disconnected, or the tab was closed
+        view_widget.search_updated.connect(self.on_search_updated)
+        self._search_view = view_widget
+    
+    def on_search_updated(self):
+        """Refresh the status as background search results come in."""
+        view_widget = self.main_window.get_current_view_widget()
+        if view_widget is None or view_widget is not self._search_view:
+            return  # The search belongs to a tab that is no longer shown
+        
+        search_results = view_widget.get_search_results()
+        success = search_results.has_results()
+        self.update_ui_state(success)
+        
+        if success:
+            # Update the status with match info
+            status = search_results.get_current_match_info()
+            if view_widget.is_search_running():
+                status += " (searching...)"
+            self.status_label.setText(status)
+        elif view_widget.is_search_running():
+            self.status_label.setText("Searching...")
+        else:
+            query_msg = f"No matches found for '{search_results.query}'"
+            # Check if this might be an image-based PDF
+            has_text = self.check_document_has_text()
+            if not has_text:
+                query_msg += " - This PDF may contain images or scanned text rather than searchable text"
+            self.status_label.setText(query_msg)
     
     def check_document_has_text(self):
         """Check if the current document appears to have searchable text"""
@@ -92,22 +145,8 @@ class SearchPanel(QFrame):
         if not view_widget or not isinstance(view_widget, PDFViewWidget) or not view_widget.doc:
             return False
             
-        # Sample a few pages to check for text
-        doc = view_widget.doc
-        max_pages = min(5, len(doc))
-        text_found = False
-        
-        for i in range(max_pages):
-            try:
-                page = doc.load_page(i)
-                text = page.get_text("text")
-                if text and len(text.strip()) > 20:  # More than 20 chars is likely real text
-                    text_found = True
-                    break
-            except:
-                continue
-                
-        return text_found
+        # Sample a few pages; their text is usually cached by the search
+        return view_widget.has_searchable_text()
     
     def on_next(self):
         """Find next match."""
@@ -1,6 +1,12 @@
 # freebird/utils/helpers.py
 
+import os
+import sys
+import fitz
 from PyQt6.QtWidgets import QMessageBox
+from freebird.constants import (
+    PDF_IN_MEMORY_MAX_BYTES, PAGE_CACHE_LIMIT_KB, PAGE_CACHE_MAX_KB, PAGE_CACHE_MEMORY_FRACTION
+)
 
 def show_message(parent, title, message, icon=QMessageBox.Icon.Information):
     """
@@ -17,4 +23,124 @@ def show_message(parent, title, message, icon=QMessageBox.Icon.Information):
     msg_box.setWindowTitle(title)
     msg_box.setText(message)
     msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-    msg_box.exec()
\ No newline at end of file
+    msg_box.exec()
+
+def open_document_source(source):
+    """
+    Opens a private fitz document for a worker process.
+    
+    Args:
+        source: A file path, or the bytes of a PDF snapshot
+            (see PDFViewWidget.get_document_source)
+    """
+    if isinstance(source, bytes):
+        return fitz.open("pdf", source)
+    return fitz.open(source)
+
+def open_pdf_file(filepath):
+    """
+    Opens a PDF file for viewing and editing.
+    
+    Files up to PDF_IN_MEMORY_MAX_BYTES are read with a single sequential
+    read and parsed from memory, which avoids MuPDF's many small seeks on
+    slow or network filesystems and leaves the file free to be overwritten
+    by a full save. Larger files are opened from disk. The type is given
+    explicitly so the content is never sniffed.
+    
+    Args:
+        filepath: Path of the PDF file
+    """
+    if os.path.getsize(filepath) <= PDF_IN_MEMORY_MAX_BYTES:
+        with open(filepath, "rb") as f:
+            data = f.read()
+        return fitz.open(stream=data, filetype="pdf")
+    return fitz.open(filepath, filetype="pdf")
+
+def save_pdf(doc, filepath, optimize=False):
+    """
+    Writes a document to a PDF file.
+    
+    A regular save only drops unused objects and compresses streams that
+    are still uncompressed, which keeps saving fast on large documents.
+    An optimized save also merges duplicate objects and cleans up page
+    content streams; the file is usually smaller but saving takes much
+    longer, since every object is compared and content is re-parsed.
+    
+    Args:
+        doc: The fitz document to save
+        filepath: Destination path
+        optimize: Whether to do the slower, size-optimizing save
+    """
+    if optimize:
+        doc.save(filepath, garbage=4, deflate=True, clean=True)
+    else:
+        doc.save(filepath, garbage=1, deflate=True)
+
+def shrink_mupdf_store(percent=100):
+    """
+    Frees MuPDF's shared store of parsed objects, fonts and images.
+    
+    The store is global to the process and keeps growing while pages are
+    copied between documents; anything still needed is simply re-parsed
+    on the next render.
+    
+    Args:
+        percent: How much of the store to free (default: all of it)
+    """
+    try:
+        fitz.TOOLS.store_shrink(percent)
+    except Exception as e:
+        print(f"WARNING: Could not shrink the MuPDF store: {e}")
+
+def available_memory_bytes():
+    """
+    Returns the physical memory currently available to applications,
+    or None if it can't be determined on this platform.
+    """
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            
+            class MEMORYSTATUSEX(ctypes.Structure):
+                _fields_ = [
+                    ("dwLength", ctypes.c_ulong),
+                    ("dwMemoryLoad", ctypes.c_ulong),
+                    ("ullTotalPhys", ctypes.c_ulonglong),
+                    ("ullAvailPhys", ctypes.c_ulonglong),
+                    ("ullTotalPageFile", ctypes.c_ulonglong),
+                    ("ullAvailPageFile", ctypes.c_ulonglong),
+                    ("ullTotalVirtual", ctypes.c_ulonglong),
+                    ("ullAvailVirtual", ctypes.c_ulonglong),
+                    ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+                ]
+            
+            status = MEMORYSTATUSEX()
+            status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+            if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+                return status.ullAvailPhys
+            return None
+        
+        # Linux reports MemAvailable, which also counts reclaimable page cache
+        if os.path.exists("/proc/meminfo"):
+            with open("/proc/meminfo") as f:
+                for line in f:
+                    if line.startswith("MemAvailable:"):
+                        return int(line.split()[1]) * 1024
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError) as e:
+        print(f"WARNING: Could not determine available memory: {e}")
+        return None
+
+def page_cache_limit_kb():
+    """
+    Size (KB) for the shared QPixmapCache of rendered pages.
+    
+    A page pixmap takes width * height * 4 bytes, so a single A4 page at
+    300 DPI is about 35 MB; the cache grows with the memory available at
+    startup, between PAGE_CACHE_LIMIT_KB and PAGE_CACHE_MAX_KB.
+    """
+    available = available_memory_bytes()
+    if not available:
+        return PAGE_CACHE_LIMIT_KB
+    budget_kb = int(available * PAGE_CACHE_MEMORY_FRACTION) // 1024
+    return max(PAGE_CACHE_LIMIT_KB, min(PAGE_CACHE_MAX_KB, budget_kb))
@@ -1,16 +1,149 @@
 # freebird/utils/thumbnail.py
 
+import os
+import shutil
+import hashlib
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import fitz
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QListWidget, QListWidgetItem, QProgressDialog
+    QListWidget, QListWidgetItem, QMessageBox
 )
 from PyQt6.QtGui import (
     QPixmap, QImage, QIcon, QPainter, QPen, QColor
 )
-from PyQt6.QtCore import Qt, QSize, QPoint, QRect
+from PyQt6.QtCore import (
+    Qt, QSize, QPoint, QRect, QTimer, QObject, QModelIndex, pyqtSignal
+)
+
+from freebird.constants import ASSEMBLY_PREFIX, CACHE_DIR
+from freebird.utils.helpers import show_message, open_document_source
+
+# Thumbnail icon box in device-independent pixels
+THUMB_WIDTH = 120
+THUMB_HEIGHT = 160
+
+# Number of grid rows above/below the viewport to render ahead of scrolling
+THUMB_PREFETCH_ROWS = 2
+
+# Page counts up to which thumbnails are rendered inline / all at once on worker
+# processes; larger documents render only the pages nearest the viewport
+THUMB_STRATEGY_THRESHOLDS = (10, 200)
+
+# Documents whose thumbnails are kept on disk; the least recently opened go first
+THUMB_DISK_CACHE_MAX_DOCUMENTS = 50
+
+def get_thumbnail_cache_dir(filepath):
+    """
+    Returns the on-disk thumbnail cache directory for a PDF file.
+    
+    The directory name is a fingerprint of the path and modification time,
+    so editing the file outside the app naturally invalidates old thumbnails.
+    Returns None for assembly documents or files that can't be stat'ed.
+    """
+    if not filepath or filepath.startswith(ASSEMBLY_PREFIX):
+        return None
+    try:
+        mtime = os.path.getmtime(filepath)
+    except OSError:
+        return None
+    fingerprint = hashlib.sha1((filepath + str(mtime)).encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, "thumbnails", fingerprint)
+
+def prune_thumbnail_cache(current_dir):
+    """
+    Deletes the thumbnail directories of all but the THUMB_DISK_CACHE_MAX_DOCUMENTS
+    most recently used documents. current_dir is marked as just used and kept.
+    
+    Every edit saved to a file gives it a new fingerprint, so without this the
+    cache would only ever grow. Only touches the file system, so it can run in
+    a background thread.
+    """
+    root = os.path.join(CACHE_DIR, "thumbnails")
+    try:
+        if os.path.isdir(current_dir):
+            os.utime(current_dir)
+        entries = []
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_dir() and entry.path != current_dir:
+                    entries.append((entry.stat().st_mtime, entry.path))
+    except OSError:
+        return  # No cache yet
+    
+    entries.sort(reverse=True)
+    for _, path in entries[THUMB_DISK_CACHE_MAX_DOCUMENTS - 1:]:
+        shutil.rmtree(path, ignore_errors=True)
+
+def save_thumbnail_png(pix, path):
+    """Writes a rendered thumbnail to the disk cache. Failures are not fatal."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        pix.save(path, output="png")
+    except Exception as e:
+        print(f"WARNING: Could not write thumbnail cache: {e}")
+
+def render_thumbnail_pixmap(doc, page_index, device_pixel_ratio=1.0):
+    """
+    Rasterizes a page thumbnail with PyMuPDF.
+    
+    The page is scaled to fit the thumbnail icon box at the screen's device
+    pixel ratio, so the icon is drawn 1:1 instead of being resampled by Qt.
+    Only touches fitz, so it can run in a worker process.
+    """
+    page = doc.load_page(page_index)
+    page_rect = page.rect
+    scale = min(THUMB_WIDTH / page_rect.width, THUMB_HEIGHT / page_rect.height) * device_pixel_ratio
+    # Annotations are unreadable at thumbnail size, so skip rendering them
+    return page.get_pixmap(matrix=fitz.Matrix(scale, scale), colorspace=fitz.csRGB,
+                           alpha=False, annots=False)
+
+def thumbnail_image_from_samples(samples, width, height, stride, device_pixel_ratio=1.0):
+    """
+    Builds a thumbnail QImage from raw RGB samples.
+    
+    The QImage wraps the sample buffer without an intermediate copy;
+    converting to RGB16 both detaches it from the buffer and halves the
+    memory each thumbnail pins (16-bit color is plenty at this size).
+    """
+    qimage = QImage(samples, width, height, stride, QImage.Format.Format_RGB888)
+    qimage = qimage.convertToFormat(QImage.Format.Format_RGB16)
+    qimage.setDevicePixelRatio(device_pixel_ratio)
+    return qimage
+
+def render_thumbnail_image(doc, page_index, device_pixel_ratio=1.0, cache_path=None):
+    """Rasterizes a page thumbnail into a QImage in the calling thread, saving it to cache_path if given."""
+    pix = render_thumbnail_pixmap(doc, page_index, device_pixel_ratio)
+    if cache_path:
+        save_thumbnail_png(pix, cache_path)
+    return thumbnail_image_from_samples(pix.samples_mv, pix.width, pix.height, pix.stride,
+                                        device_pixel_ratio)
+
+# ============================================================
+#  Background thumbnail rendering
+# ============================================================
+# PyMuPDF holds the GIL while rasterizing, so a worker thread would stall the
+# GUI just the same; thumbnails are rendered in worker processes. Each worker
+# opens its own copy of the document once, in the initializer.
+_worker_doc = None
 
-from freebird.utils.helpers import show_message
+def _init_thumb_worker(source):
+    """Executor initializer: opens the document from a file path or PDF bytes."""
+    global _worker_doc
+    _worker_doc = open_document_source(source)
+
+def _render_thumb(page_index, device_pixel_ratio, cache_path):
+    """Executor task: renders one thumbnail, writes it to cache_path if given and returns its raw samples."""
+    pix = render_thumbnail_pixmap(_worker_doc, page_index, device_pixel_ratio)
+    if cache_path:
+        save_thumbnail_png(pix, cache_path)
+    return page_index, pix.samples, pix.width, pix.height, pix.stride
+
+class ThumbnailSignals(QObject):
+    """Carries finished renders from executor callbacks to the GUI thread."""
+    thumb_ready = pyqtSignal(int, bytes, int, int, int)
 
 class ThumbnailViewDialog(QDialog):
     """Dialog showing thumbnails of all pages for visual reordering."""
@@ -19,12 +152,22 @@ class ThumbnailViewDialog(QDialog):
         super().__init__(parent)
         self.pdf_widget = pdf_widget
         self.doc = pdf_widget.get_document()
-        self.thumbnails = []
         self.drag_start_position = None
         self.drag_item = None
         self.drop_indicator_index = -1
         self.dragging = False
         
+        # Background rendering state
+        self.thumb_items = {}  # {original page index: QListWidgetItem}
+        self.render_cancelled = threading.Event()
+        self.render_executor = None
+        self.render_futures = {}    # {page index: Future} for submitted renders
+        self.lazy_rendering = False  # render only around the viewport
+        self.pending_pages = set()  # pages still showing a placeholder
+        self.thumb_signals = ThumbnailSignals()
+        self.thumb_signals.thumb_ready.connect(self.on_thumbnail_ready)
+        self.disk_cache_dir = None
+        
         self.setWindowTitle("Reorder Pages")
         self.setMinimumSize(800, 600)
         
@@ -45,27 +188,92 @@ class ThumbnailViewDialog(QDialog):
                 super().__init__()
                 self.dialog = parent
                 self.setViewMode(QListWidget.ViewMode.IconMode)
-                self.setIconSize(QSize(120, 160))
+                self.setIconSize(QSize(THUMB_WIDTH, THUMB_HEIGHT))
                 self.setResizeMode(QListWidget.ResizeMode.Adjust)
                 self.setDragDropMode(QListWidget.DragDropMode.InternalMove)
                 self.setAcceptDrops(True)
                 self.setDragEnabled(True)
                 self.setSpacing(10)
                 self.setGridSize(QSize(150, 210))
+                self.setUniformItemSizes(True)  # every cell is the same size; skip per-item measuring
                 self.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
                 self.viewport().setAcceptDrops(True)
                 
-                # Style for drop indicator
+                # Item rects are cached in viewport coordinates until something moves them
+                self._rect_cache = {}  # {row: QRect}
+                self.horizontalScrollBar().valueChanged.connect(self.invalidate_rect_cache)
+                self.verticalScrollBar().valueChanged.connect(self.invalidate_rect_cache)
+                model = self.model()
+                for signal in (model.rowsInserted, model.rowsRemoved, model.rowsMoved,
+                               model.modelReset, model.layoutChanged):
+                    signal.connect(self.invalidate_rect_cache)
+                
+                # Render thumbnails as they scroll into view
+                self.verticalScrollBar().valueChanged.connect(self.dialog.request_visible_thumbnails)
+                
+                # Style for the selected item. No :hover rule, which would
+                # repaint items as the cursor crosses them during a drag
                 self.setStyleSheet("""
                     QListWidget::item:selected { 
                         background: #d0e0ff; 
                         border: 2px solid #3080ff;
                     }
-                    QListWidget::item:hover { 
-                        background: #e0f0ff; 
-                    }
                 """)
             
+            def item_rect(self, row):
+                """visualItemRect() of a row, cached until scrolling or relayout."""
+                rect = self._rect_cache.get(row)
+                if rect is None:
+                    rect = self.visualItemRect(self.item(row))
+                    self._rect_cache[row] = rect
+                return QRect(rect)
+            
+            def invalidate_rect_cache(self, *args):
+                self._rect_cache = {}
+            
+            def updateGeometries(self):
+                # Called after the (delayed) icon layout runs
+                self.invalidate_rect_cache()
+                super().updateGeometries()
+            
+            def grid_columns(self):
+                """Number of thumbnails per grid row at the current width."""
+                return max(1, self.viewport().width() // self.gridSize().width())
+            
+            def visible_index_range(self, margin_rows=0):
+                """
+                Returns (first, last) rows of items in or near the viewport.
+                
+                Computed from the fixed grid geometry rather than hit-testing,
+                since indexAt() misses in the gaps between icons.
+                """
+                count = self.count()
+                if count == 0:
+                    return 0, -1
+                columns = self.grid_columns()
+                grid_height = self.gridSize().height()
+                top = self.item_rect(0).top()  # negative once scrolled
+                first_row = max(0, (-top) // grid_height - margin_rows)
+                last_row = (self.viewport().height() - top) // grid_height + margin_rows
+                return first_row * columns, min(count - 1, (last_row + 1) * columns - 1)
+            
+            def grid_index_at(self, pos):
+                """Row of the grid cell under pos (clamped to the list), like indexAt() without the gaps."""
+                count = self.count()
+                if count == 0:
+                    return -1
+                origin = self.item_rect(0).topLeft()
+                columns = self.grid_columns()
+                column = min(columns - 1, max(0, (pos.x() - origin.x()) // self.gridSize().width()))
+                row = max(0, (pos.y() - origin.y()) // self.gridSize().height())
+                return min(count - 1, row * columns + column)
+            
+            def resizeEvent(self, event):
+                self.invalidate_rect_cache()
+                super().resizeEvent(event)
+                # Wait for the icon layout to adjust before measuring it
+                QTimer.singleShot(0, self.dialog.request_visible_thumbnails)
+            
             def dragEnterEvent(self, event):
                 if event.source() == self:
                     event.accept()
@@ -73,24 +281,45 @@ class ThumbnailViewDialog(QDialog):
                 else:
                     event.ignore()
             
+            def drop_indicator_rect(self, index):
+                """Viewport area the drop indicator covers for an index (empty if none)."""
+                if index < 0 or self.count() == 0:
+                    return QRect()
+                if index < self.count():
+                    rect = self.item_rect(index)
+                else:
+                    rect = self.item_rect(self.count() - 1)
+                    rect.moveLeft(rect.right() + 5)
+                # Line on the left edge, 3px wide
+                return QRect(rect.left() - 2, rect.top() - 2, 5, rect.height() + 4)
+            
+            def set_drop_indicator(self, index):
+                """Moves the drop indicator, repainting only the old and new spots."""
+                old_index = self.dialog.drop_indicator_index
+                if index == old_index:
+                    return
+                self.dialog.drop_indicator_index = index
+                self.viewport().update(self.drop_indicator_rect(old_index).united(self.drop_indicator_rect(index)))
+            
             def dragMoveEvent(self, event):
                 if event.source() == self:
                     pos = event.position().toPoint()
                     index = self.indexAt(pos)
+                    drop_indicator_index = self.dialog.drop_indicator_index
                     
                     # If over a valid item, prepare to show drop indicator
                     if index.isValid():
-                        self.dialog.drop_indicator_index = index.row()
+                        drop_indicator_index = index.row()
                     else:
                         # If not over a valid item, find nearest column
                         item_count = self.count()
                         if item_count > 0:
                             # Handle drop at the end of the list
-                            rect = self.visualItemRect(self.item(item_count - 1))
+                            rect = self.item_rect(item_count - 1)
                             if pos.x() > rect.right():
-                                self.dialog.drop_indicator_index = item_count
+                                drop_indicator_index = item_count
                     
-                    self.viewport().update()
+                    self.set_drop_indicator(drop_indicator_index)
                     event.accept()
                 else:
                     event.ignore()
@@ -108,15 +337,8 @@ class ThumbnailViewDialog(QDialog):
                         if self.dialog.drop_indicator_index >= self.count():
                             drop_index = self.count() - 1
                         else:
-                            # Try to find closest item
-                            closest_dist = float('inf')
-                            for i in range(self.count()):
-                                rect = self.visualItemRect(self.item(i))
-                                center = rect.center()
-                                dist = (center.x() - pos.x())**2 + (center.y() - pos.y())**2
-                                if dist < closest_dist:
-                                    closest_dist = dist
-                                    drop_index = i
+                            # Use the grid cell under the cursor
+                            drop_index = self.grid_index_at(pos)
                     
                     # Get the source item
                     source_items = self.selectedItems()
@@ -136,17 +358,13 @@ class ThumbnailViewDialog(QDialog):
                     if drop_index < 0:
                         drop_index = self.count() - 1
                     
-                    # Take item from old position
-                    item = self.takeItem(source_index)
-                    
-                    # Insert it at new position, adjusting for position change
-                    if source_index < drop_index:
-                        self.insertItem(drop_index, item)
-                    else:
-                        self.insertItem(drop_index, item)
+                    # Move the row in the model; the destination is the row it is
+                    # inserted before, counted before the move
+                    self.model().moveRow(QModelIndex(), source_index, QModelIndex(),
+                                         drop_index + (1 if drop_index > source_index else 0))
                     
                     # Select the moved item
-                    self.setCurrentItem(item)
+                    self.setCurrentRow(drop_index)
                     
                     # Enable apply button
                     self.dialog.apply_button.setEnabled(True)
@@ -161,9 +379,8 @@ class ThumbnailViewDialog(QDialog):
                     event.ignore()
             
             def dragLeaveEvent(self, event):
-                self.dialog.drop_indicator_index = -1
+                self.set_drop_indicator(-1)
                 self.dialog.dragging = False
-                self.viewport().update()
                 super().dragLeaveEvent(event)
             
             def paintEvent(self, event):
@@ -178,13 +395,13 @@ class ThumbnailViewDialog(QDialog):
                     
                     # Draw indicator line
                     if self.dialog.drop_indicator_index < self.count():
-                        rect = self.visualItemRect(self.item(self.dialog.drop_indicator_index))
+                        rect = self.item_rect(self.dialog.drop_indicator_index)
                         # Draw a line on the left side of the item
                         painter.drawLine(rect.left(), rect.top(), rect.left(), rect.bottom())
                     else:
                         # We're dropping at the end - draw after last item
                         if self.count() > 0:
-                            rect = self.visualItemRect(self.item(self.count() - 1))
+                            rect = self.item_rect(self.count() - 1)
                             # Draw a line on the right side of the last item
                             painter.drawLine(rect.right() + 5, rect.top(), 
                                            rect.right() + 5, rect.bottom())
@@ -212,44 +429,174 @@ class ThumbnailViewDialog(QDialog):
         layout.addLayout(button_layout)
     
     def load_thumbnails(self):
-        """Load thumbnails for all pages."""
+        """Load thumbnails for all pages, rendering cache misses in the background."""
         if not self.doc:
             return
             
         self.list_widget.clear()
-        self.thumbnails.clear()
+        self.thumb_items = {}
+        self.pending_pages = set()
+        self.render_futures = {}
+        
+        # In-memory cache lives on the view widget so it survives dialog reopen;
+        # the disk cache is only valid while the document matches the file on disk
+        self.disk_cache_dir = None
+        if not self.pdf_widget.is_document_modified():
+            self.disk_cache_dir = get_thumbnail_cache_dir(self.pdf_widget.get_filepath())
+        if self.disk_cache_dir:
+            threading.Thread(target=prune_thumbnail_cache, args=(self.disk_cache_dir,), daemon=True).start()
+        
+        placeholder = QPixmap(THUMB_WIDTH, THUMB_HEIGHT)
+        placeholder.fill(QColor(220, 220, 220))
         
-        # Use a progress dialog for many pages
-        if self.pdf_widget.total_pages > 10:
-            progress = QProgressDialog("Loading thumbnails...", "Cancel", 0, self.pdf_widget.total_pages, self)
-            progress.setWindowModality(Qt.WindowModality.WindowModal)
-            
         for i in range(self.pdf_widget.total_pages):
-            if self.pdf_widget.total_pages > 10:
-                progress.setValue(i)
-                if progress.wasCanceled():
-                    break
-            
-            # Render a thumbnail
-            page = self.doc.load_page(i)
-            matrix = fitz.Matrix(0.2, 0.2)  # Scale down for thumbnail
-            pix = page.get_pixmap(matrix=matrix, alpha=False)
+            pixmap = self.pdf_widget.find_thumbnail(i)
+            if pixmap is None:
+                pixmap = self.load_cached_thumbnail(self.disk_cache_dir, i)
+                if pixmap is not None:
+                    self.pdf_widget.store_thumbnail(i, pixmap)
             
-            # Convert to QImage and QPixmap
-            qimage = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888)
-            pixmap = QPixmap.fromImage(qimage)
-            
-            # Create item
+            # Create item, with a placeholder icon until the render arrives
             item = QListWidgetItem()
-            item.setIcon(QIcon(pixmap))
+            item.setIcon(QIcon(pixmap if pixmap is not None else placeholder))
             item.setText(f"Page {i+1}")
             item.setData(Qt.ItemDataRole.UserRole, i)  # Store page index
             
             self.list_widget.addItem(item)
-            self.thumbnails.append(pixmap)
+            self.thumb_items[i] = item
+            if pixmap is None:
+                self.pending_pages.add(i)
+        
+        self.start_thumbnail_rendering()
+    
+    def start_thumbnail_rendering(self):
+        """Renders placeholder pages with a strategy that suits the document size."""
+        inline_max, eager_max = THUMB_STRATEGY_THRESHOLDS
+        total_pages = self.pdf_widget.total_pages
+        self.lazy_rendering = total_pages > eager_max
+        
+        if total_pages <= inline_max:
+            # Too few pages to pay for starting workers
+            device_pixel_ratio = self.devicePixelRatioF()
+            for page_index in sorted(self.pending_pages):
+                try:
+                    qimage = render_thumbnail_image(self.doc, page_index, device_pixel_ratio,
+                                                    self.cached_thumbnail_path(self.disk_cache_dir, page_index))
+                except Exception as e:
+                    print(f"ERROR: Render thumbnail for page {page_index + 1}: {e}")
+                    continue
+                self.set_thumbnail(page_index, qimage)
+        elif not self.lazy_rendering:
+            # Few enough pages to queue them all, in order
+            if self.pending_pages:
+                self.start_render_executor()
+                self.submit_renders(sorted(self.pending_pages))
+        else:
+            # Only the pages around the viewport are rendered; scrolling asks for more
+            QTimer.singleShot(0, self.request_visible_thumbnails)
+    
+    def request_visible_thumbnails(self):
+        """Queues renders for placeholder pages within THUMB_PREFETCH_ROWS of the viewport."""
+        if not self.lazy_rendering or self.render_cancelled.is_set() or not self.pending_pages:
+            return
+        
+        first, last = self.list_widget.visible_index_range(THUMB_PREFETCH_ROWS)
+        wanted = set()
+        for row in range(first, last + 1):
+            page_index = self.list_widget.item(row).data(Qt.ItemDataRole.UserRole)
+            if page_index in self.pending_pages:
+                wanted.add(page_index)
+        
+        # Drop renders for pages that scrolled away, unless a worker already has them
+        for page_index, future in list(self.render_futures.items()):
+            if page_index not in wanted and future.cancel():
+                del self.render_futures[page_index]
+        
+        if self.render_executor is None:
+            self.start_render_executor()
+        self.submit_renders(wanted)
+    
+    def start_render_executor(self):
+        """Starts the worker processes, each with its own copy of the document."""
+        self.render_executor = ProcessPoolExecutor(
+            max_workers=os.cpu_count() or 1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_thumb_worker,
+            initargs=(self.pdf_widget.get_document_source(),))
+    
+    def submit_renders(self, page_indices):
+        """Submits renders to the executor for pages not already submitted."""
+        device_pixel_ratio = self.devicePixelRatioF()
+        for page_index in page_indices:
+            if page_index not in self.render_futures:
+                future = self.render_executor.submit(_render_thumb, page_index, device_pixel_ratio,
+                                                     self.cached_thumbnail_path(self.disk_cache_dir, page_index))
+                future.add_done_callback(self.on_render_done)
+                self.render_futures[page_index] = future
+    
+    def on_render_done(self, future):
+        """Future callback; runs on an executor thread, so only emits a signal."""
+        if future.cancelled():
+            return
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"ERROR: Render thumbnail: {e}")
+            return
+        self.thumb_signals.thumb_ready.emit(*result)
+    
+    def on_thumbnail_ready(self, page_index, samples, width, height, stride):
+        """Slot receiving a rendered thumbnail from a worker."""
+        if self.render_cancelled.is_set():
+            return
+        self.render_futures.pop(page_index, None)
+        qimage = thumbnail_image_from_samples(samples, width, height, stride, self.devicePixelRatioF())
+        self.set_thumbnail(page_index, qimage)
+    
+    def set_thumbnail(self, page_index, qimage):
+        """Replaces a page's placeholder with its rendered thumbnail and caches it."""
+        item = self.thumb_items.get(page_index)
+        if item is None:
+            return
         
-        if self.pdf_widget.total_pages > 10:
-            progress.setValue(self.pdf_widget.total_pages)
+        # The item's QIcon and the thumbnail cache share this pixmap's data. Keep the
+        # RGB16 format; by default Qt would promote it back to 32-bit
+        pixmap = QPixmap.fromImage(qimage, Qt.ImageConversionFlag.NoFormatConversion)
+        item.setIcon(QIcon(pixmap))
+        self.pending_pages.discard(page_index)
+        self.pdf_widget.store_thumbnail(page_index, pixmap)
+    
+    def stop_thumbnail_rendering(self):
+        """Cancels queued renders; workers have their own documents, so no need to wait."""
+        self.render_cancelled.set()
+        self.render_futures = {}
+        if self.render_executor is not None:
+            self.render_executor.shutdown(wait=False, cancel_futures=True)
+            self.render_executor = None
+    
+    def done(self, result):
+        """Stops background rendering whenever the dialog closes."""
+        self.stop_thumbnail_rendering()
+        super().done(result)
+    
+    def cached_thumbnail_path(self, cache_dir, page_index):
+        """Disk cache file for a page at the dialog's device pixel ratio, or None without a cache."""
+        if not cache_dir:
+            return None
+        return os.path.join(cache_dir, f"{page_index}@{self.devicePixelRatioF():g}x.png")
+    
+    def load_cached_thumbnail(self, cache_dir, page_index):
+        """Loads a thumbnail from the disk cache, or returns None on a miss."""
+        if not cache_dir:
+            return None
+        path = self.cached_thumbnail_path(cache_dir, page_index)
+        if not os.path.exists(path):
+            return None
+        pixmap = QPixmap(path)
+        if pixmap.isNull():
+            return None
+        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+        return pixmap
     
     def on_thumbnail_double_clicked(self, item):
         """Handler for double-clicking a thumbnail."""
@@ -271,29 +618,24 @@ class ThumbnailViewDialog(QDialog):
             self.accept()
             return
         
+        # Renders still in flight would arrive for the old page order
+        self.stop_thumbnail_rendering()
+        
         # Apply the new order
         try:
-            # Create a copy of the document with pages in the new order
-            new_doc = fitz.open()
-            
-            for new_index, old_index in enumerate(new_order):
-                new_doc.insert_pdf(self.doc, from_page=old_index, to_page=old_index)
-            
-            # Close current document and replace the document object (without saving to disk)
-            current_path = self.pdf_widget.get_filepath()
+            # Permute the page tree in place (without saving to disk); this is
+            # a single pass, unlike copying page by page into a new document
             current_page = self.pdf_widget.current_page
-            self.pdf_widget.doc.close()
-            self.pdf_widget.doc = new_doc
+            self.doc.select(new_order)
             
             # Update document properties
-            self.pdf_widget.total_pages = len(new_doc)
             self.pdf_widget.current_page = min(current_page, self.pdf_widget.total_pages - 1)
             
-            # Clear cache to ensure updated rendering
-            self.pdf_widget.pixmap_cache = {}
+            # Pages only changed position, so move their cached renders along
+            self.pdf_widget.remap_page_caches(new_order)
             
             # Mark as modified but don't save to disk
-            self.pdf_widget.mark_modified(True)
+            self.pdf_widget.mark_modified(True, keep_page_caches=True)
             
             # Refresh the display
             self.pdf_widget.display_page()